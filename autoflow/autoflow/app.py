@@ -12,6 +12,7 @@ import time
 from pathlib import Path
 
 from get_secret_or_env_var import getenv
+from prefect.engine.executors import LocalDaskExecutor
 
 from autoflow.model import init_db
 from autoflow.parser import parse_workflows_yaml
@@ -72,4 +73,7 @@ def main(run_on_schedule: bool = True):
         cdr_types=sensor_config["cdr_types"],
         workflow_storage=workflow_storage,
         run_on_schedule=run_on_schedule,
+        # Notebooks are executed in separate kernel processes, so running
+        # tasks in threads is sufficient for workflow runs to execute in parallel.
+        executor=LocalDaskExecutor(scheduler="threads"),
     )
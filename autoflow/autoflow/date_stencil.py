@@ -7,7 +7,7 @@ Defines the DateStencil class, to represent a pattern of dates relative to a ref
 """
 
 import datetime
-from typing import Iterable, List, Optional, Sequence, Set, Tuple, Union
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import pendulum
 
@@ -67,6 +67,21 @@ class DateStencil:
                 self._validate_date_element(element)
                 intervals.append((element, self._next_day(element)))
         self._intervals = tuple(intervals)
+        # Dates in intervals which don't depend on the reference date can be
+        # calculated once, rather than every time availability is checked.
+        absolute_dates = set()
+        relative_intervals = []
+        for interval in self._intervals:
+            if all(isinstance(element, datetime.date) for element in interval):
+                absolute_dates.update(
+                    self._dates_in_interval(
+                        *(self._offset_to_date(element, None) for element in interval)
+                    )
+                )
+            else:
+                relative_intervals.append(interval)
+        self._absolute_dates = frozenset(absolute_dates)
+        self._relative_intervals = tuple(relative_intervals)
 
     @staticmethod
     def _validate_date_element(element):
@@ -83,6 +98,16 @@ class DateStencil:
         else:
             return element + 1
 
+    @staticmethod
+    def _dates_in_interval(
+        start_date: pendulum.Date, end_date: pendulum.Date
+    ) -> Iterator[pendulum.Date]:
+        """
+        Iterate over the dates in the half-open interval [start_date, end_date).
+        """
+        for days in range((end_date - start_date).days):
+            yield start_date.add(days=days)
+
     @staticmethod
     def _offset_to_date(
         offset: Union[int, datetime.date], reference_date: datetime.date
@@ -206,8 +231,21 @@ class DateStencil:
         If the stencil is not valid for the given reference date (i.e. contains
         invalid date pairs), this function will return False.
         """
-        try:
-            set_of_dates = self.as_set_of_dates(reference_date=reference_date)
-        except InvalidDateIntervalError:
+        if not isinstance(available_dates, (set, frozenset)):
+            available_dates = set(available_dates)
+        # Check the dates which don't depend on the reference date first, so
+        # that we can return early without calculating any other dates.
+        if not self._absolute_dates.issubset(available_dates):
             return False
-        return set_of_dates.issubset(set(available_dates))
+        for element in self._relative_intervals:
+            start_date = self._offset_to_date(element[0], reference_date)
+            end_date = self._offset_to_date(element[1], reference_date)
+            if end_date <= start_date:
+                # Stencil is not valid for this reference date
+                return False
+            if not all(
+                date in available_dates
+                for date in self._dates_in_interval(start_date, end_date)
+            ):
+                return False
+        return True
@@ -9,7 +9,7 @@ Defines the 'WorkflowRuns' class, which represents  the 'workflow_runs' database
 import os
 import enum
 import json
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 
 import pendulum
 from sqlalchemy import (
@@ -90,6 +90,34 @@ class WorkflowRuns(Base):
         session.add(row)
         session.flush()
 
+    @classmethod
+    def set_states(
+        cls,
+        workflow_runs: Sequence[Tuple[str, Dict[str, Any]]],
+        state: RunState,
+        session: "sqlalchemy.orm.session.Session",
+    ) -> None:
+        """
+        Add a new row to the workflow runs table for each of a sequence of
+        (workflow_name, parameters) combinations, in a single bulk insert.
+
+        Parameters
+        ----------
+        workflow_runs : sequence of tuple (str, dict)
+            Pairs of workflow name and the parameters passed when running the workflow
+        state : RunState
+            The state of the workflow runs
+        session : Session
+            A sqlalchemy session for a DB in which this model exists.
+        """
+        session.bulk_save_objects(
+            [
+                cls(workflow_name, get_params_hash(parameters), state)
+                for workflow_name, parameters in workflow_runs
+            ]
+        )
+        session.flush()
+
     @classmethod
     def get_most_recent_state(
         cls,
@@ -129,6 +157,49 @@ class WorkflowRuns(Base):
         else:
             return None
 
+    @classmethod
+    def get_most_recent_states(
+        cls,
+        workflow_runs: Sequence[Tuple[str, Dict[str, Any]]],
+        session: "sqlalchemy.orm.session.Session",
+    ) -> List[Optional[RunState]]:
+        """
+        Get the most recent state for each of a sequence of (workflow_name, parameters)
+        combinations, using a single query.
+
+        Parameters
+        ----------
+        workflow_runs : sequence of tuple (str, dict)
+            Pairs of workflow name and the parameters passed when running the workflow
+        session : Session
+            A sqlalchemy session for a DB in which this model exists.
+
+        Returns
+        -------
+        list of RunState or None
+            Most recent state for each workflow run (or None if no state has been set),
+            in the same order as workflow_runs.
+        """
+        keys = [
+            (workflow_name, get_params_hash(parameters))
+            for workflow_name, parameters in workflow_runs
+        ]
+        if len(keys) == 0:
+            return []
+        rows = (
+            session.query(cls.workflow_name, cls.parameters_hash, cls.state)
+            .filter(
+                cls.workflow_name.in_({name for name, _ in keys}),
+                cls.parameters_hash.in_({params_hash for _, params_hash in keys}),
+            )
+            .order_by(cls.timestamp.desc())
+            .all()
+        )
+        most_recent_states = {}
+        for workflow_name, parameters_hash, state in rows:
+            most_recent_states.setdefault((workflow_name, parameters_hash), state)
+        return [most_recent_states.get(key) for key in keys]
+
 
 def init_db(db_uri: str, force: bool = False) -> None:
     """
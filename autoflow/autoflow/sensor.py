@@ -6,6 +6,7 @@
 Defines 'available_dates_sensor' prefect flow.
 """
 
+import datetime
 import warnings
 from typing import Any, Dict, List, NamedTuple, NoReturn, Optional, Sequence, Tuple
 
@@ -14,6 +15,7 @@ import prefect
 from get_secret_or_env_var import environ, getenv
 from prefect import Flow, Parameter, task, unmapped
 from prefect.engine import signals
+from prefect.engine.cache_validators import all_inputs
 from prefect.schedules import CronSchedule
 from prefect.triggers import all_successful, any_failed
 
@@ -22,6 +24,7 @@ import flowclient
 from autoflow.date_stencil import DateStencil
 from autoflow.model import RunState, WorkflowRuns
 from autoflow.utils import session_scope
+from autoflow.workflows import get_flowapi_url
 
 
 class WorkflowConfig(NamedTuple):
@@ -50,9 +53,11 @@ class WorkflowConfig(NamedTuple):
 # Tasks -----------------------------------------------------------------------
 
 
-@task
+# Results are cached for a short time so that repeated sensor runs with the same
+# CDR types and FlowAPI URL don't need to re-query FlowAPI and re-parse the dates.
+@task(cache_for=datetime.timedelta(minutes=10), cache_validator=all_inputs)
 def get_available_dates(
-    cdr_types: Optional[Sequence[str]] = None,
+    cdr_types: Optional[Sequence[str]] = None, flowapi_url: Optional[str] = None,
 ) -> List[pendulum.Date]:
     """
     Task to return a union of the dates for which data is available in FlowDB for the specified set of CDR types.
@@ -62,22 +67,31 @@ def get_available_dates(
     cdr_types : list of str, optional
         Subset of CDR types for which to find available dates.
         If not provided, the union of available dates for all CDR types will be returned.
+    flowapi_url : str, optional
+        URL of the FlowAPI server to get available dates from.
+        If not provided, the FlowAPI URL set in the prefect config will be used.
+        Pass this as an input (e.g. from the get_flowapi_url task) so that
+        cached results are only re-used for the same FlowAPI server.
     
     Returns
     -------
     list of pendulum.Date
         List of available dates, in chronological order
     """
+    if flowapi_url is None:
+        flowapi_url = prefect.config.flowapi_url
     prefect.context.logger.info(
-        f"Getting available dates from FlowAPI at '{prefect.config.flowapi_url}'."
+        f"Getting available dates from FlowAPI at '{flowapi_url}'."
     )
     conn = flowclient.connect(
-        url=prefect.config.flowapi_url,
+        url=flowapi_url,
         token=environ["FLOWAPI_TOKEN"],
         ssl_certificate=getenv("SSL_CERTIFICATE_FILE"),
     )
     dates = flowclient.get_available_dates(connection=conn)
-    prefect.context.logger.debug(f"Available dates: {dates}")
+    # Pass large values as logging arguments, so that they're only formatted if
+    # debug logging is enabled
+    prefect.context.logger.debug("Available dates: %s", dates)
     if cdr_types is None:
         prefect.context.logger.debug(
             "No CDR types provided. Will return available dates for all CDR types."
@@ -90,14 +104,16 @@ def get_available_dates(
         unknown_cdr_types = set(cdr_types).difference(dates.keys())
         if unknown_cdr_types:
             warnings.warn(f"No data available for CDR types {unknown_cdr_types}.")
-    dates_union = set.union(
-        *[
-            set(pendulum.parse(date, exact=True) for date in dates[cdr_type])
-            for cdr_type in cdr_types
-            if cdr_type in dates.keys()
-        ]
-    )
-    return sorted(list(dates_union))
+    # Take the union of the date strings before parsing, so that each date is only parsed once
+    date_strings_union = set()
+    for cdr_type in cdr_types:
+        if cdr_type in dates:
+            date_strings_union.update(dates[cdr_type])
+    dates_union = [
+        pendulum.date(date.year, date.month, date.day)
+        for date in map(datetime.date.fromisoformat, date_strings_union)
+    ]
+    return sorted(dates_union)
 
 
 @task
@@ -124,25 +140,25 @@ def filter_dates(
         Filtered list of dates
     """
     prefect.context.logger.info(f"Filtering list of available dates.")
-    filtered_dates = list(available_dates)
-
-    if workflow_config.earliest_date is None:
+    earliest_date = workflow_config.earliest_date
+    if earliest_date is None:
         prefect.context.logger.debug("No earliest date provided.")
     else:
         prefect.context.logger.debug(
-            f"Filtering out dates earlier than {workflow_config.earliest_date}."
+            f"Filtering out dates earlier than {earliest_date}."
         )
-        filtered_dates = [
-            date for date in filtered_dates if date >= workflow_config.earliest_date
-        ]
 
     prefect.context.logger.debug(
         f"Returning reference dates for which all dates in stencil are available."
     )
+    # Build the set of available dates once, rather than once per reference date
+    available_dates_set = frozenset(available_dates)
+    # Apply both filters in a single pass over the available dates
     filtered_dates = [
         date
-        for date in filtered_dates
-        if workflow_config.date_stencil.dates_are_available(date, available_dates)
+        for date in available_dates
+        if (earliest_date is None or date >= earliest_date)
+        and workflow_config.date_stencil.dates_are_available(date, available_dates_set)
     ]
 
     return filtered_dates
@@ -179,8 +195,8 @@ def get_parametrised_workflows(
     prefect.context.logger.info(
         "Adding parameters 'reference_date' and 'date_ranges' to workflow parameters."
     )
-    prefect.context.logger.debug(f"Workflow configs: {workflow_configs}")
-    prefect.context.logger.debug(f"Dates: {lists_of_dates}")
+    prefect.context.logger.debug("Workflow configs: %s", workflow_configs)
+    prefect.context.logger.debug("Dates: %s", lists_of_dates)
     return [
         (
             workflow_storage.get_flow(workflow_config.workflow_name),
@@ -198,7 +214,44 @@ def get_parametrised_workflows(
 
 
 @task
-def skip_if_already_run(parametrised_workflow: Tuple[Flow, Dict[str, Any]]) -> None:
+def get_most_recent_states(
+    parametrised_workflows: List[Tuple[Flow, Dict[str, Any]]]
+) -> List[Optional[RunState]]:
+    """
+    Task to get the most recent state of each of a list of parametrised workflows,
+    using a single database query.
+
+    Parameters
+    ----------
+    parametrised_workflows : list of tuple (prefect.Flow, dict)
+        Workflows, and associated parameters, for which previous runs should be checked
+
+    Returns
+    -------
+    list of RunState or None
+        Most recent state of each workflow run (or None if it has not run before),
+        in the same order as parametrised_workflows.
+    """
+    # Note: This is a 'reduce' task, so that the states of all workflow runs
+    # can be fetched in one round-trip to the database.
+    prefect.context.logger.info(
+        f"Getting most recent states of {len(parametrised_workflows)} workflow runs."
+    )
+    with session_scope(prefect.config.db_uri) as session:
+        return WorkflowRuns.get_most_recent_states(
+            workflow_runs=[
+                (workflow.name, parameters)
+                for workflow, parameters in parametrised_workflows
+            ],
+            session=session,
+        )
+
+
+@task
+def skip_if_already_run(
+    parametrised_workflow: Tuple[Flow, Dict[str, Any]],
+    most_recent_state: Optional[RunState],
+) -> None:
     """
     Task to raise a SKIP signal if a workflow is already running or has previously run successfully
     with the given parameters.
@@ -207,6 +260,9 @@ def skip_if_already_run(parametrised_workflow: Tuple[Flow, Dict[str, Any]]) -> N
     ----------
     parametrised_workflow : tuple (prefect.Flow, dict)
         Workflow, and associated parameters, for which previous runs should be checked
+    most_recent_state : RunState or None
+        Most recent state of this workflow with these parameters
+        (as returned by get_most_recent_states), or None if it has not run before
 
     Raises
     ------
@@ -217,30 +273,26 @@ def skip_if_already_run(parametrised_workflow: Tuple[Flow, Dict[str, Any]]) -> N
     prefect.context.logger.info(
         f"Checking whether workflow '{workflow.name}' has already run successfully with parameters {parameters}."
     )
-    with session_scope(prefect.config.db_uri) as session:
-        state = WorkflowRuns.get_most_recent_state(
-            workflow_name=workflow.name, parameters=parameters, session=session
-        )
 
-    if state is None:
+    if most_recent_state is None:
         prefect.context.logger.debug(
             f"Workflow '{workflow.name}' has not previously run with parameters {parameters}."
         )
-    elif state == RunState.failed:
+    elif most_recent_state == RunState.failed:
         prefect.context.logger.debug(
             f"Workflow '{workflow.name}' previously failed with parameters {parameters}."
         )
-    elif state == RunState.running:
+    elif most_recent_state == RunState.running:
         raise signals.SKIP(
             f"Workflow '{workflow.name}' is already running with parameters {parameters}."
         )
-    elif state == RunState.success:
+    elif most_recent_state == RunState.success:
         raise signals.SKIP(
             f"Workflow '{workflow.name}' previously ran successfully with parameters {parameters}."
         )
     else:
         # This should never happen
-        raise ValueError(f"Unrecognised workflow state: '{state}'.")
+        raise ValueError(f"Unrecognised workflow state: '{most_recent_state}'.")
 
 
 @task
@@ -270,6 +322,41 @@ def record_workflow_run_state(
         )
 
 
+@task
+def record_workflows_running(
+    parametrised_workflows: List[Tuple[Flow, Dict[str, Any]]],
+    most_recent_states: List[Optional[RunState]],
+) -> None:
+    """
+    Add rows to the database to record that workflow runs are starting, for all
+    parametrised workflows that have not previously run or previously failed
+    (i.e. those that will not be skipped by skip_if_already_run).
+
+    Parameters
+    ----------
+    parametrised_workflows : list of tuple (prefect.Flow, dict)
+        Workflows, and associated parameters, for which to record state.
+    most_recent_states : list of RunState or None
+        Most recent state of each workflow run (as returned by get_most_recent_states).
+    """
+    # Note: This is a 'reduce' task, so that all 'running' states can be
+    # recorded in a single insert.
+    workflow_runs = [
+        (workflow.name, parameters)
+        for (workflow, parameters), most_recent_state in zip(
+            parametrised_workflows, most_recent_states
+        )
+        if most_recent_state in (None, RunState.failed)
+    ]
+    prefect.context.logger.debug(
+        f"Recording {len(workflow_runs)} workflow runs as '{RunState.running.name}'."
+    )
+    with session_scope(prefect.config.db_uri) as session:
+        WorkflowRuns.set_states(
+            workflow_runs=workflow_runs, state=RunState.running, session=session
+        )
+
+
 @task
 def run_workflow(parametrised_workflow: Tuple[Flow, Dict[str, Any]]) -> None:
     """
@@ -308,7 +395,7 @@ with Flow(name="Available dates sensor") as available_dates_sensor:
     # TODO: Read workflow configs from a db table, so that new workflows could be added while the date sensor is running.
     workflow_configs = Parameter("workflow_configs")
     available_dates = get_available_dates(
-        cdr_types=Parameter("cdr_types", required=False)
+        cdr_types=Parameter("cdr_types", required=False), flowapi_url=get_flowapi_url(),
     )
     filtered_dates = filter_dates.map(
         available_dates=unmapped(available_dates), workflow_config=workflow_configs
@@ -319,15 +406,26 @@ with Flow(name="Available dates sensor") as available_dates_sensor:
         workflow_storage=Parameter("workflow_storage"),
     )
 
-    running = record_workflow_run_state.map(
+    # Note: Workflow run states are recorded synchronously, rather than queued
+    # for a background writer. A 'running' state must be committed before a
+    # workflow starts (otherwise a concurrent sensor run could start it again),
+    # and the 'success' states determine the state of this flow. Recording
+    # states does not hold up other workflow runs, since the mapped tasks run
+    # concurrently.
+    most_recent_states = get_most_recent_states(
+        parametrised_workflows=parametrised_workflows
+    )
+    skip = skip_if_already_run.map(
         parametrised_workflow=parametrised_workflows,
-        state=unmapped(RunState.running),
-        upstream_tasks=[
-            skip_if_already_run.map(parametrised_workflow=parametrised_workflows)
-        ],
+        most_recent_state=most_recent_states,
+    )
+    running = record_workflows_running(
+        parametrised_workflows=parametrised_workflows,
+        most_recent_states=most_recent_states,
     )
     workflow_runs = run_workflow.map(
-        parametrised_workflow=parametrised_workflows, upstream_tasks=[running]
+        parametrised_workflow=parametrised_workflows,
+        upstream_tasks=[skip, unmapped(running)],
     )
     success = record_workflow_run_state.map(
         parametrised_workflow=parametrised_workflows,
@@ -9,6 +9,7 @@ Utility functions.
 import collections
 import json
 from contextlib import contextmanager
+from functools import lru_cache
 from hashlib import md5
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -62,9 +63,26 @@ def get_params_hash(parameters: Dict[str, Any]) -> str:
     str
         md5 hash of the parameters dict
     """
-    return md5(
-        json.dumps(dict(parameters), sort_keys=True, default=str).encode()
-    ).hexdigest()
+    return _get_md5_hash(json.dumps(dict(parameters), sort_keys=True, default=str))
+
+
+@lru_cache(maxsize=256)
+def _get_md5_hash(string: str) -> str:
+    """
+    Generate a md5 hash string from a string. Results are cached, because the
+    same parameters are hashed repeatedly while running a workflow.
+
+    Parameters
+    ----------
+    string : str
+        String to hash
+
+    Returns
+    -------
+    str
+        md5 hash of the string
+    """
+    return md5(string.encode()).hexdigest()
 
 
 def get_session(db_uri: str) -> "sqlalchemy.orm.session.Session":
@@ -84,8 +102,28 @@ def get_session(db_uri: str) -> "sqlalchemy.orm.session.Session":
     # TODO: This seems like the wrong place to be reading a secret / env var,
     # but we can't put a docker secret in the prefect config.
     full_db_uri = db_uri.format(getenv("AUTOFLOW_DB_PASSWORD", ""))
-    engine = create_engine(full_db_uri)
-    return sessionmaker(bind=engine)()
+    return _get_sessionmaker(full_db_uri)()
+
+
+@lru_cache(maxsize=None)
+def _get_sessionmaker(full_db_uri: str) -> "sqlalchemy.orm.session.sessionmaker":
+    """
+    Create a sqlalchemy session factory bound to an engine for the given database.
+    The result is cached, so that all sessions for the same database share a
+    single engine (and therefore a single connection pool).
+
+    Parameters
+    ----------
+    full_db_uri : str
+        Database URI, including password
+
+    Returns
+    -------
+    sessionmaker
+        A sqlalchemy session factory
+    """
+    engine = create_engine(full_db_uri, pool_pre_ping=True)
+    return sessionmaker(bind=engine)
 
 
 @contextmanager
@@ -127,11 +165,31 @@ def make_json_serialisable(obj: Any) -> Union[dict, list, str, int, float, bool,
     Returns
     -------
     dict, list, str, int, float, bool or None
-        The same object after dumping to json (converting to str if necessary) and loading
+        The same object after dumping to json (converting to str if necessary) and loading.
+        If the object is already composed only of these types, it is returned unchanged.
     """
+    if _is_json_native(obj):
+        # Dumping and loading would produce an identical object
+        return obj
     return json.loads(json.dumps(obj, default=str))
 
 
+def _is_json_native(obj: Any) -> bool:
+    """
+    Check whether an object is composed only of types that would be unchanged by
+    dumping to json and loading (i.e. dicts with str keys, lists, str, int, float,
+    bool and None). Subclasses of these types (e.g. tuples, OrderedDicts, enums)
+    are not considered native.
+    """
+    if type(obj) is dict:
+        return all(
+            type(key) is str and _is_json_native(value) for key, value in obj.items()
+        )
+    if type(obj) is list:
+        return all(_is_json_native(item) for item in obj)
+    return obj is None or type(obj) in (str, int, float, bool)
+
+
 def get_additional_parameter_names_for_notebooks(
     notebooks: Dict[str, Dict[str, Any]],
     reserved_parameter_names: Optional[Set[str]] = None,
@@ -257,6 +315,11 @@ def asciidoc_to_pdf(
     resources : ResourcesDict
         Dictionary of resources, as returned from nbconvert exporter
     """
+    if not resources["outputs"]:
+        # No resources to write alongside the document, so there's no need
+        # for a temporary directory - pass the document in on stdin instead.
+        asciidoctor_pdf("-", o=output_path, _in=body)
+        return
     with TemporaryDirectory() as tmpdir:
         with open(f"{tmpdir}/tmp.asciidoc", "w") as f_tmp:
             f_tmp.write(body)
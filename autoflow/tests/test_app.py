@@ -0,0 +1,47 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from unittest.mock import Mock
+
+from prefect.engine.executors import LocalDaskExecutor
+
+from autoflow.app import main
+
+
+def test_main_runs_sensor_with_threaded_dask_executor(monkeypatch, tmpdir):
+    """
+    Test that main runs the available dates sensor with the parsed sensor config,
+    using a LocalDaskExecutor with the threaded scheduler.
+    """
+    monkeypatch.setenv("AUTOFLOW_LOG_LEVEL", "ERROR")
+    monkeypatch.setenv("AUTOFLOW_OUTPUTS_DIR", str(tmpdir))
+    monkeypatch.setenv("AUTOFLOW_DB_URI", "DUMMY_DB_URI")
+    monkeypatch.setenv("AUTOFLOW_INPUTS_DIR", "DUMMY_INPUTS_DIR")
+    monkeypatch.setattr("autoflow.app.init_db", Mock())
+    sensor_config = {
+        "schedule": "DUMMY_SCHEDULE",
+        "workflows": "DUMMY_WORKFLOW_CONFIGS",
+        "cdr_types": "DUMMY_CDR_TYPES",
+    }
+    monkeypatch.setattr(
+        "autoflow.app.parse_workflows_yaml",
+        Mock(return_value=("DUMMY_WORKFLOW_STORAGE", sensor_config)),
+    )
+    sensor_mock = Mock()
+    monkeypatch.setattr("autoflow.app.available_dates_sensor", sensor_mock)
+
+    main(run_on_schedule=False)
+
+    assert sensor_mock.schedule == "DUMMY_SCHEDULE"
+    sensor_mock.run.assert_called_once()
+    executor = sensor_mock.run.call_args[1]["executor"]
+    assert isinstance(executor, LocalDaskExecutor)
+    assert executor.scheduler == "threads"
+    sensor_mock.run.assert_called_once_with(
+        workflow_configs="DUMMY_WORKFLOW_CONFIGS",
+        cdr_types="DUMMY_CDR_TYPES",
+        workflow_storage="DUMMY_WORKFLOW_STORAGE",
+        run_on_schedule=False,
+        executor=executor,
+    )
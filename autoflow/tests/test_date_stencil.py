@@ -156,6 +156,19 @@ def test_dates_are_available(reference_date, available):
     )
 
 
+def test_dates_are_available_missing_absolute_date():
+    """
+    Test that DateStencil.dates_are_available returns False for any reference date
+    if an absolute date in the stencil is not available.
+    """
+    date_stencil = DateStencil([pendulum.date(2016, 1, 1), [-1, 0]])
+    available_dates = {pendulum.date(2016, 1, d) for d in range(2, 6)}
+    assert not any(
+        date_stencil.dates_are_available(reference_date, available_dates)
+        for reference_date in available_dates
+    )
+
+
 def test_date_stencil_eq():
     """
     Test that a DateStencil is equal to another DateStencil created using the same raw stencil,
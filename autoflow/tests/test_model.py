@@ -64,6 +64,26 @@ def test_set_state_with_sqlite(sqlite_session):
     assert pendulum.instance(row.timestamp) == now
 
 
+def test_set_states(session):
+    """
+    Test that set_states adds a row for each workflow run, with the same state.
+    """
+    workflow_runs = [
+        ("DUMMY_WORKFLOW_NAME_1", {"DUMMY_PARAM_NAME": "DUMMY_PARAM_VALUE"}),
+        ("DUMMY_WORKFLOW_NAME_2", {"DUMMY_PARAM_NAME": "DUMMY_PARAM_VALUE"}),
+    ]
+    WorkflowRuns.set_states(
+        workflow_runs=workflow_runs, state=RunState.running, session=session
+    )
+
+    rows = session.query(WorkflowRuns).order_by(WorkflowRuns.workflow_name).all()
+    assert len(rows) == 2
+    for row, (workflow_name, parameters) in zip(rows, workflow_runs):
+        assert row.workflow_name == workflow_name
+        assert row.parameters_hash == get_params_hash(parameters)
+        assert row.state == RunState.running
+
+
 def test_exception_raised_with_invalid_state(session):
     """
     Test that we get an exception raised when we try
@@ -112,6 +132,41 @@ def test_get_most_recent_state_returns_None(session):
     assert state is None
 
 
+def test_get_most_recent_states(session):
+    """
+    Test that get_most_recent_states returns the most recent state for each
+    workflow run, in the order requested, and None for workflow runs with no previous state.
+    """
+    workflow_run_data_1 = dict(
+        workflow_name="DUMMY_WORKFLOW_NAME_1",
+        parameters={"DUMMY_PARAM_NAME": "DUMMY_PARAM_VALUE"},
+    )
+    workflow_run_data_2 = dict(
+        workflow_name="DUMMY_WORKFLOW_NAME_2",
+        parameters={"DUMMY_PARAM_NAME": "DUMMY_PARAM_VALUE"},
+    )
+    WorkflowRuns.set_state(
+        **workflow_run_data_1, state=RunState.running, session=session
+    )
+    WorkflowRuns.set_state(
+        **workflow_run_data_1, state=RunState.success, session=session
+    )
+    WorkflowRuns.set_state(
+        **workflow_run_data_2, state=RunState.failed, session=session
+    )
+
+    states = WorkflowRuns.get_most_recent_states(
+        workflow_runs=[
+            ("DUMMY_WORKFLOW_NAME_2", {"DUMMY_PARAM_NAME": "DUMMY_PARAM_VALUE"}),
+            ("DUMMY_WORKFLOW_NAME_1", {"DUMMY_PARAM_NAME": "DUMMY_PARAM_VALUE"}),
+            ("DUMMY_WORKFLOW_NAME_1", {"DUMMY_PARAM_NAME": "OTHER_PARAM_VALUE"}),
+        ],
+        session=session,
+    )
+
+    assert states == [RunState.failed, RunState.success, None]
+
+
 def test_init_db_doesnt_wipe(postgres_test_db):
     """
     DB shouldn't get reinitialised if already built.
@@ -4,12 +4,14 @@
 
 import pytest
 
+from datetime import timedelta
 from unittest.mock import call, create_autospec, Mock
 
 import pendulum
 import prefect
 from prefect.core import Edge
 from prefect.engine import TaskRunner
+from prefect.engine.cache_validators import all_inputs
 from prefect.engine.state import Failed, Success
 from prefect.environments.storage import Memory
 from prefect.schedules import CronSchedule
@@ -22,8 +24,10 @@ from autoflow.sensor import (
     available_dates_sensor,
     filter_dates,
     get_available_dates,
+    get_most_recent_states,
     get_parametrised_workflows,
     record_workflow_run_state,
+    record_workflows_running,
     run_workflow,
     skip_if_already_run,
     WorkflowConfig,
@@ -68,6 +72,49 @@ def test_get_available_dates(monkeypatch, test_logger):
     ]
 
 
+def test_get_available_dates_is_cached(monkeypatch, test_logger):
+    """
+    Test that get_available_dates re-uses its result for repeated runs with the
+    same inputs, without calling FlowAPI again, and that the cached result is
+    not re-used for a different FlowAPI URL.
+    """
+    assert get_available_dates.cache_for == timedelta(minutes=10)
+    assert get_available_dates.cache_validator is all_inputs
+
+    connect_mock = Mock()
+    flowclient_get_available_dates_mock = Mock(
+        return_value={"cdr_type_1": ["2016-01-01"]}
+    )
+    monkeypatch.setattr("flowclient.connect", connect_mock)
+    monkeypatch.setattr(
+        "flowclient.get_available_dates", flowclient_get_available_dates_mock
+    )
+    monkeypatch.setenv("FLOWAPI_TOKEN", "DUMMY_TOKEN")
+
+    with prefect.Flow("DUMMY_FLOW") as flow:
+        available_dates = get_available_dates(
+            flowapi_url=prefect.Parameter("flowapi_url")
+        )
+
+    with prefect.context(caches={}, logger=test_logger):
+        first_state = flow.run(parameters=dict(flowapi_url="DUMMY_URL_1"))
+        second_state = flow.run(parameters=dict(flowapi_url="DUMMY_URL_1"))
+        assert flowclient_get_available_dates_mock.call_count == 1
+        flow.run(parameters=dict(flowapi_url="DUMMY_URL_2"))
+
+    assert flowclient_get_available_dates_mock.call_count == 2
+    assert connect_mock.call_args_list == [
+        call(ssl_certificate=None, url="DUMMY_URL_1", token="DUMMY_TOKEN"),
+        call(ssl_certificate=None, url="DUMMY_URL_2", token="DUMMY_TOKEN"),
+    ]
+    assert second_state.result[available_dates].is_cached()
+    assert (
+        second_state.result[available_dates].result
+        == first_state.result[available_dates].result
+        == [pendulum.date(2016, 1, 1)]
+    )
+
+
 def test_get_available_dates_ssl_certificate(monkeypatch, test_logger):
     flowclient_available_dates = {
         "cdr_type_1": ["2016-01-01", "2016-01-03"],
@@ -263,6 +310,40 @@ def test_get_parametrised_workflows(test_logger):
         }
 
 
+def test_get_most_recent_states(monkeypatch, test_logger):
+    """
+    Test that the get_most_recent_states task gets the states of all parametrised workflows in one call.
+    """
+    get_session_mock = Mock()
+    get_most_recent_states_mock = Mock(return_value=[RunState.success, None])
+    monkeypatch.setattr("autoflow.utils.get_session", get_session_mock)
+    monkeypatch.setattr(
+        "autoflow.sensor.WorkflowRuns.get_most_recent_states",
+        get_most_recent_states_mock,
+    )
+    parametrised_workflows = [
+        (prefect.Flow(name="DUMMY_WORFLOW_NAME"), {"DUMMY_PARAM": "DUMMY_VALUE_1"}),
+        (prefect.Flow(name="DUMMY_WORFLOW_NAME"), {"DUMMY_PARAM": "DUMMY_VALUE_2"}),
+    ]
+
+    with set_temporary_config({"db_uri": "DUMMY_DB_URI"}), prefect.context(
+        logger=test_logger
+    ):
+        states = get_most_recent_states.run(
+            parametrised_workflows=parametrised_workflows
+        )
+
+    get_session_mock.assert_called_once_with("DUMMY_DB_URI")
+    get_most_recent_states_mock.assert_called_once_with(
+        workflow_runs=[
+            ("DUMMY_WORFLOW_NAME", {"DUMMY_PARAM": "DUMMY_VALUE_1"}),
+            ("DUMMY_WORFLOW_NAME", {"DUMMY_PARAM": "DUMMY_VALUE_2"}),
+        ],
+        session=get_session_mock.return_value,
+    )
+    assert states == [RunState.success, None]
+
+
 @pytest.mark.parametrize(
     "state,is_skipped",
     [
@@ -272,62 +353,43 @@ def test_get_parametrised_workflows(test_logger):
         (None, False),
     ],
 )
-def test_skip_if_already_run(monkeypatch, test_logger, state, is_skipped):
+def test_skip_if_already_run(test_logger, state, is_skipped):
     """
     Test that the skip_if_already_run task skips if the workflow's most recent
     state is 'running' or 'success', and does not skip if the state is
     None (i.e. not run before) or 'failed'.
     """
-    get_session_mock = Mock()
-    get_most_recent_state_mock = Mock(return_value=state)
-    monkeypatch.setattr("autoflow.utils.get_session", get_session_mock)
-    monkeypatch.setattr(
-        "autoflow.sensor.WorkflowRuns.get_most_recent_state", get_most_recent_state_mock
-    )
-
     runner = TaskRunner(task=skip_if_already_run)
-    upstream_edge = Edge(
-        prefect.Task(), skip_if_already_run, key="parametrised_workflow"
-    )
-    with set_temporary_config({"db_uri": "DUMMY_DB_URI"}):
-        task_state = runner.run(
-            upstream_states={
-                upstream_edge: Success(
-                    result=(
-                        prefect.Flow(name="DUMMY_WORFLOW_NAME"),
-                        {"DUMMY_PARAM": "DUMMY_VALUE"},
-                    )
-                )
-            },
-            context=dict(logger=test_logger),
-        )
-
-    get_session_mock.assert_called_once_with("DUMMY_DB_URI")
-    get_most_recent_state_mock.assert_called_once_with(
-        workflow_name="DUMMY_WORFLOW_NAME",
-        parameters={"DUMMY_PARAM": "DUMMY_VALUE"},
-        session=get_session_mock.return_value,
+    upstream_edges = {
+        Edge(prefect.Task(), skip_if_already_run, key="parametrised_workflow"): Success(
+            result=(
+                prefect.Flow(name="DUMMY_WORFLOW_NAME"),
+                {"DUMMY_PARAM": "DUMMY_VALUE"},
+            )
+        ),
+        Edge(prefect.Task(), skip_if_already_run, key="most_recent_state"): Success(
+            result=state
+        ),
+    }
+    task_state = runner.run(
+        upstream_states=upstream_edges, context=dict(logger=test_logger)
     )
+
     assert task_state.is_successful()
     assert is_skipped == task_state.is_skipped()
 
 
-def test_skip_if_already_run_unrecognised_state(monkeypatch, test_logger):
+def test_skip_if_already_run_unrecognised_state(test_logger):
     """
-    Test that skip_if_already_run raises a ValueError if get_most_recent_state
-    returns an unrecognised state.
+    Test that skip_if_already_run raises a ValueError if the most recent
+    state is unrecognised.
     """
-    monkeypatch.setattr("autoflow.utils.get_session", Mock())
-    monkeypatch.setattr(
-        "autoflow.sensor.WorkflowRuns.get_most_recent_state",
-        Mock(return_value="BAD_STATE"),
-    )
-
-    with set_temporary_config({"db_uri": "DUMMY_DB_URI"}), prefect.context(
-        logger=test_logger
-    ), pytest.raises(ValueError, match="Unrecognised workflow state: 'BAD_STATE'"):
+    with prefect.context(logger=test_logger), pytest.raises(
+        ValueError, match="Unrecognised workflow state: 'BAD_STATE'"
+    ):
         skip_if_already_run.run(
-            (prefect.Flow(name="DUMMY_WORFLOW_NAME"), {"DUMMY_PARAM": "DUMMY_VALUE"})
+            (prefect.Flow(name="DUMMY_WORFLOW_NAME"), {"DUMMY_PARAM": "DUMMY_VALUE"}),
+            most_recent_state="BAD_STATE",
         )
 
 
@@ -358,6 +420,37 @@ def test_record_workflow_run_state(monkeypatch, test_logger):
     )
 
 
+def test_record_workflows_running(monkeypatch, test_logger):
+    """
+    Test that the record_workflows_running task calls WorkflowRuns.set_states
+    once, for only those workflows that have not previously run or previously failed.
+    """
+    get_session_mock = Mock()
+    set_states_mock = Mock()
+    monkeypatch.setattr("autoflow.utils.get_session", get_session_mock)
+    monkeypatch.setattr("autoflow.sensor.WorkflowRuns.set_states", set_states_mock)
+    states = [None, RunState.running, RunState.success, RunState.failed]
+    parametrised_workflows = [
+        (prefect.Flow(name="DUMMY_FLOW"), {"DUMMY_PARAM": i})
+        for i in range(len(states))
+    ]
+    with set_temporary_config({"db_uri": "DUMMY_DB_URI"}), prefect.context(
+        logger=test_logger
+    ):
+        record_workflows_running.run(
+            parametrised_workflows=parametrised_workflows, most_recent_states=states
+        )
+    get_session_mock.assert_called_once_with("DUMMY_DB_URI")
+    set_states_mock.assert_called_once_with(
+        workflow_runs=[
+            ("DUMMY_FLOW", {"DUMMY_PARAM": 0}),
+            ("DUMMY_FLOW", {"DUMMY_PARAM": 3}),
+        ],
+        state=RunState.running,
+        session=get_session_mock.return_value,
+    )
+
+
 def test_run_workflow(test_logger):
     """
     Test that the run_workflow task runs a workflow with the given parameters.
@@ -536,10 +629,11 @@ def test_available_dates_sensor(monkeypatch, postgres_test_db):
         "flowclient.get_available_dates", lambda connection: flowclient_available_dates
     )
 
-    # Run available dates sensor again
+    # Run available dates sensor again (clearing the task cache so that the
+    # new available dates are picked up)
     with set_temporary_config(
         {"flowapi_url": "DUMMY_URL", "db_uri": postgres_test_db.url()}
-    ):
+    ), prefect.context(caches={}):
         flow_state = available_dates_sensor.run(
             cdr_types=["cdr_type_1", "cdr_type_2"],
             workflow_configs=workflow_configs,
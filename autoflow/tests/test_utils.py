@@ -117,6 +117,16 @@ def test_get_session_without_password(monkeypatch):
     )
 
 
+def test_get_session_reuses_engine():
+    """
+    Test that sessions created by get_session for the same database share an engine.
+    """
+    s1 = get_session("postgresql://DUMMY_USER@DUMMY_HOST:6666/DUMMY_NAME")
+    s2 = get_session("postgresql://DUMMY_USER@DUMMY_HOST:6666/DUMMY_NAME")
+    assert s1 is not s2
+    assert s1.bind is s2.bind
+
+
 def test_session_scope(monkeypatch):
     """
     Test that session_scope closes the session.
@@ -165,6 +175,15 @@ def test_make_json_serialisable(before, expected):
     assert json.dumps(after) == expected
 
 
+def test_make_json_serialisable_returns_json_native_object_unchanged():
+    """
+    Test that make_json_serialisable returns an object composed only of json types
+    without converting it.
+    """
+    before = {"a": [1, 2.0, "3", None, True], "b": {"c": "d"}}
+    assert make_json_serialisable(before) is before
+
+
 def test_get_additional_parameter_names_for_notebooks():
     """
     Test that get_additional_parameter_names_for_notebooks returns the set of
@@ -329,3 +348,20 @@ def test_asciidoc_to_pdf(monkeypatch):
     args, kwargs = asciidoctor_pdf_mock.call_args
     assert not Path(args[0]).exists()
     assert kwargs["o"] == "DUMMY_OUTPUT_PATH"
+
+
+def test_asciidoc_to_pdf_without_resources(monkeypatch):
+    """
+    Test that asciidoc_to_pdf passes the asciidoc body to asciidoctor_pdf on stdin
+    if there are no resources to write to files.
+    """
+    asciidoctor_pdf_mock = Mock()
+    monkeypatch.setattr("autoflow.utils.asciidoctor_pdf", asciidoctor_pdf_mock)
+
+    asciidoc_to_pdf(
+        body="DUMMY_BODY", resources=dict(outputs={}), output_path="DUMMY_OUTPUT_PATH"
+    )
+
+    asciidoctor_pdf_mock.assert_called_once_with(
+        "-", o="DUMMY_OUTPUT_PATH", _in="DUMMY_BODY"
+    )
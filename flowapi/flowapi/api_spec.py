@@ -4,20 +4,21 @@
 
 from apispec import APISpec, yaml_utils
 from quart import Blueprint, request, render_template, current_app
-from zmq.asyncio import Socket
 from flowapi import __version__
+from flowapi.flowmachine_connection import RequestSocket
 from flowapi.permissions import schema_to_scopes
 
 blueprint = Blueprint("spec", __name__)
 
 
-async def get_spec(socket: Socket, request_id: str) -> APISpec:
+async def get_spec(socket: RequestSocket, request_id: str) -> APISpec:
     """
     Construct open api spec by interrogating FlowMachine.
 
     Parameters
     ----------
-    socket : Socket
+    socket : RequestSocket
+        Socket to send the request to FlowMachine over
     request_id : str
         Unique id of the request
 
@@ -54,6 +54,7 @@ def get_config():
 
         flowmachine_host = environ["FLOWMACHINE_HOST"]
         flowmachine_port = environ["FLOWMACHINE_PORT"]
+        flowmachine_reply_timeout = float(getenv("FLOWMACHINE_REPLY_TIMEOUT", 300))
 
         flowdb_user = environ["FLOWAPI_FLOWDB_USER"]
         flowdb_password = environ["FLOWAPI_FLOWDB_PASSWORD"]
@@ -71,6 +72,7 @@ def get_config():
         FLOWAPI_LOG_LEVEL=log_level,
         FLOWMACHINE_HOST=flowmachine_host,
         FLOWMACHINE_PORT=flowmachine_port,
+        FLOWMACHINE_REPLY_TIMEOUT=flowmachine_reply_timeout,
         FLOWDB_DSN=f"postgres://{flowdb_user}:{flowdb_password}@{flowdb_host}:{flowdb_port}/flowdb",
         JWT_DECODE_AUDIENCE=flowapi_server_id,
     )
@@ -0,0 +1,195 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import asyncio
+import uuid
+from typing import Dict
+
+import rapidjson
+import zmq
+from zmq.asyncio import Context
+
+
+class FlowmachineConnection:
+    """
+    A single ZMQ DEALER socket connected to the FlowMachine server, which is
+    shared by all requests. Any number of messages can be in flight at once;
+    each message is sent with a unique routing frame, which the server returns
+    with the reply so that replies can be matched to the messages they answer.
+
+    Parameters
+    ----------
+    host : str
+        FlowMachine server host
+    port : int or str
+        FlowMachine server port
+    logger : structlog.BoundLogger
+        Logger to use for errors when receiving replies
+    reply_timeout : float, default 300
+        Number of seconds a request will wait for its reply before giving up
+
+    Attributes
+    ----------
+    receive_retry_interval : float
+        Number of seconds to wait before trying to receive again after an error
+    """
+
+    receive_retry_interval = 0.1
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        logger: "structlog.BoundLogger",
+        reply_timeout: float = 300,
+    ):
+        self.logger = logger
+        self.reply_timeout = reply_timeout
+        self.socket = Context.instance().socket(zmq.DEALER)
+        self.socket.connect(f"tcp://{host}:{port}")
+        self._pending_replies: Dict[bytes, asyncio.Future] = {}
+        self._dispatcher = asyncio.ensure_future(self._dispatch_replies())
+
+    async def _dispatch_replies(self) -> None:
+        """
+        Receive replies from the server, and pass each to the request awaiting it.
+        Errors receiving or decoding a single reply are logged, and do not stop
+        later replies from being dispatched. If dispatching stops, any requests
+        still awaiting replies are failed.
+        """
+        try:
+            while True:
+                try:
+                    *envelope, reply = await self.socket.recv_multipart()
+                except zmq.ZMQError as exc:
+                    if self.socket.closed:
+                        break
+                    # The socket can't be used again after these errors
+                    if exc.errno in (zmq.ETERM, zmq.ENOTSOCK):
+                        self.logger.error(
+                            "Socket for FlowMachine server is no longer usable.",
+                            exception=exc,
+                        )
+                        break
+                    self.logger.error(
+                        "Error receiving reply from FlowMachine server.", exception=exc
+                    )
+                    # Don't retry in a tight loop if the error persists
+                    await asyncio.sleep(self.receive_retry_interval)
+                    continue
+                try:
+                    message_id, empty_delimiter = envelope
+                    reply_future = self._pending_replies.pop(message_id)
+                except (ValueError, KeyError):
+                    self.logger.error(
+                        "Received reply which does not match any pending request. Ignoring it.",
+                        envelope=envelope,
+                    )
+                    continue
+                if reply_future.done():
+                    continue
+                try:
+                    reply_future.set_result(rapidjson.loads(reply))
+                except ValueError as exc:
+                    self.logger.error(
+                        "Received reply which is not valid JSON.", reply=reply
+                    )
+                    reply_future.set_exception(exc)
+        finally:
+            for reply_future in list(self._pending_replies.values()):
+                if not reply_future.done():
+                    reply_future.set_exception(
+                        ConnectionError(
+                            "Stopped receiving replies from FlowMachine server."
+                        )
+                    )
+
+    def send_json(self, msg: dict) -> asyncio.Future:
+        """
+        Send a message to the FlowMachine server.
+
+        Parameters
+        ----------
+        msg : dict
+            JSON-serialisable message
+
+        Returns
+        -------
+        asyncio.Future
+            Future which will be resolved with the reply
+        """
+        message_id = uuid.uuid4().hex.encode()
+        reply_future = asyncio.get_event_loop().create_future()
+        self._pending_replies[message_id] = reply_future
+        reply_future.add_done_callback(
+            lambda _: self._pending_replies.pop(message_id, None)
+        )
+        # The send is not awaited, so that send_json keeps the non-blocking
+        # interface of a REQ socket's send_json. A DEALER socket queues outgoing
+        # messages, so the send completes without waiting for the server; if it
+        # fails, the error is passed on to the request awaiting the reply.
+        sent = self.socket.send_multipart(
+            [message_id, b"", rapidjson.dumps(msg).encode()]
+        )
+        sent.add_done_callback(
+            lambda sent: self._forward_send_error(sent, reply_future)
+        )
+        return reply_future
+
+    @staticmethod
+    def _forward_send_error(sent: asyncio.Future, reply_future: asyncio.Future) -> None:
+        """
+        Fail the request awaiting a reply if its message could not be sent.
+        """
+        if reply_future.done() or sent.cancelled():
+            return
+        if sent.exception() is not None:
+            reply_future.set_exception(sent.exception())
+
+    def socket_for_request(self) -> "RequestSocket":
+        """
+        Get a socket-like object for use while handling a single request.
+        """
+        return RequestSocket(self)
+
+    def close(self) -> None:
+        """
+        Stop receiving replies and close the socket.
+        """
+        self._dispatcher.cancel()
+        for reply_future in list(self._pending_replies.values()):
+            reply_future.cancel()
+        self.socket.close()
+
+
+class RequestSocket:
+    """
+    A view of a FlowmachineConnection with the send_json/recv_json interface of
+    a REQ socket, to be used while handling a single request.
+
+    Parameters
+    ----------
+    connection : FlowmachineConnection
+        The shared connection to send messages over
+    """
+
+    def __init__(self, connection: FlowmachineConnection):
+        self._connection = connection
+        self._reply = None
+
+    def send_json(self, msg: dict) -> None:
+        self._reply = self._connection.send_json(msg)
+
+    async def recv_json(self) -> dict:
+        if self._reply is None:
+            raise RuntimeError("recv_json called before send_json")
+        try:
+            return await asyncio.wait_for(
+                self._reply, timeout=self._connection.reply_timeout
+            )
+        finally:
+            # Stop waiting for the reply if the request was cancelled
+            if self._reply is not None:
+                self._reply.cancel()
+                self._reply = None
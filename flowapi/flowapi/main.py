@@ -9,10 +9,9 @@ import sys
 from quart import Quart, request, current_app
 import asyncpg
 import logging
-import zmq
-from zmq.asyncio import Context
 
 from flowapi.config import get_config
+from flowapi.flowmachine_connection import FlowmachineConnection
 from flowapi.jwt_auth_callbacks import register_logging_callbacks
 from flowapi.query_endpoints import blueprint as query_endpoints_blueprint
 from flowapi.geography import blueprint as geography_blueprint
@@ -77,28 +76,29 @@ async def connect_logger():
 
 
 async def connect_zmq():
-    context = Context.instance()
-    #  Socket to talk to server
+    #  Socket to talk to server, shared by all requests
     current_app.flowapi_logger.debug("Connecting to FlowMachine server…")
-    socket = context.socket(zmq.REQ)
-    socket.connect(
-        f"tcp://{current_app.config['FLOWMACHINE_HOST']}:{current_app.config['FLOWMACHINE_PORT']}"
+    current_app.flowmachine_connection = FlowmachineConnection(
+        host=current_app.config["FLOWMACHINE_HOST"],
+        port=current_app.config["FLOWMACHINE_PORT"],
+        logger=current_app.flowapi_logger,
+        reply_timeout=current_app.config["FLOWMACHINE_REPLY_TIMEOUT"],
     )
-    request.socket = socket
     current_app.flowapi_logger.debug("Connected.")
 
 
+async def close_zmq():
+    current_app.flowapi_logger.debug("Closing connection to FlowMachine server…")
+    current_app.flowmachine_connection.close()
+    current_app.flowapi_logger.debug("Closed socket.")
+
+
 async def add_uuid():
     request.request_id = str(uuid.uuid4())
 
 
-def close_zmq(exc):
-    current_app.flowapi_logger.debug("Closing connection to FlowMachine server…")
-    try:
-        request.socket.close()
-        current_app.flowapi_logger.debug("Closed socket.")
-    except AttributeError:
-        current_app.flowapi_logger.debug("No socket to close.")
+async def add_socket():
+    request.socket = current_app.flowmachine_connection.socket_for_request()
 
 
 async def create_db():
@@ -114,9 +114,10 @@ def create_app():
     jwt = JWTManager(app)
     app.before_serving(connect_logger)
     app.before_serving(create_db)
+    app.before_serving(connect_zmq)
+    app.after_serving(close_zmq)
     app.before_request(add_uuid)
-    app.before_request(connect_zmq)
-    app.teardown_request(close_zmq)
+    app.before_request(add_socket)
 
     @app.route("/")
     async def root():
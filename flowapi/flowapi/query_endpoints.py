@@ -2,6 +2,9 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+from functools import lru_cache
+from urllib.parse import quote
+
 from quart_jwt_extended import jwt_required, current_user
 from quart import Blueprint, current_app, request, url_for, stream_with_context, jsonify
 from .stream_results import stream_result_as_json
@@ -9,6 +12,28 @@ from .stream_results import stream_result_as_json
 blueprint = Blueprint("query", __name__)
 
 
+@lru_cache(maxsize=None)
+def _get_query_url_template(endpoint: str, script_root: str) -> str:
+    """
+    Build a URL for a query endpoint once, with a placeholder for the query ID.
+    The script root is included in the cache key because the URL depends on it.
+    Must be called inside a request context.
+    """
+    return url_for(endpoint, query_id="__QUERY_ID__").replace(
+        "__QUERY_ID__", "{query_id}"
+    )
+
+
+def _query_url(endpoint: str, query_id: str) -> str:
+    """
+    Equivalent to url_for(endpoint, query_id=query_id), without rebuilding the
+    URL from the routing rules for every request.
+    """
+    return _get_query_url_template(endpoint, request.script_root).format(
+        query_id=quote(query_id, safe="/:")
+    )
+
+
 @blueprint.route("/run", methods=["POST"])
 @jwt_required
 async def run_query():
@@ -73,8 +98,8 @@ async def run_query():
     elif reply["status"] == "success":
         assert "query_id" in reply["payload"]
         d = {
-            "Location": url_for(
-                f"query.poll_query", query_id=reply["payload"]["query_id"]
+            "Location": _query_url(
+                "query.poll_query", query_id=reply["payload"]["query_id"]
             )
         }
         return {}, 202, d
@@ -157,7 +182,7 @@ async def poll_query(query_id):
             return (
                 jsonify({}),
                 303,
-                {"Location": url_for(f"query.get_query_result", query_id=query_id)},
+                {"Location": _query_url("query.get_query_result", query_id=query_id)},
             )
         elif query_state in ("executing", "queued"):
             return {"status": query_state, "msg": reply["msg"]}, 202
@@ -7,7 +7,7 @@ from quart import current_app, request
 
 
 async def stream_result_as_json(
-    sql_query, result_name="query_result", additional_elements=None
+    sql_query, result_name="query_result", additional_elements=None, chunk_size=1000
 ):
     """
     Generate a JSON representation of a query result.
@@ -20,6 +20,9 @@ async def stream_result_as_json(
         Name of the JSON item containing the rows of the result
     additional_elements : dict
         Additional JSON elements to include along with the query result
+    chunk_size : int, default 1000
+        Number of rows to fetch from the database at a time, and to
+        send in each chunk of the response
 
     Yields
     ------
@@ -47,9 +50,22 @@ async def stream_result_as_json(
             logger.debug("Got transaction.", request_id=request.request_id)
             logger.debug(f"Running {sql_query}", request_id=request.request_id)
             try:
-                async for row in connection.cursor(sql_query):
-                    yield f"{prepend}{json.dumps(dict(row.items()), number_mode=json.NM_DECIMAL, datetime_mode=json.DM_ISO8601)}".encode()
-                    prepend = ", "
+                # Encode rows in batches, to avoid sending one chunk per row
+                rows = []
+                async for row in connection.cursor(sql_query, prefetch=chunk_size):
+                    rows.append(
+                        json.dumps(
+                            dict(row.items()),
+                            number_mode=json.NM_DECIMAL,
+                            datetime_mode=json.DM_ISO8601,
+                        )
+                    )
+                    if len(rows) == chunk_size:
+                        yield f"{prepend}{', '.join(rows)}".encode()
+                        prepend = ", "
+                        rows = []
+                if rows:
+                    yield f"{prepend}{', '.join(rows)}".encode()
                 logger.debug("Finishing up.", request_id=request.request_id)
                 yield b"]}"
             except Exception as e:
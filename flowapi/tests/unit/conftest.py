@@ -6,12 +6,11 @@ from json import JSONDecodeError
 
 import asyncpg
 import pytest
-import zmq
 from _pytest.capture import CaptureResult
 
+from flowapi.flowmachine_connection import FlowmachineConnection
 from flowapi.main import create_app
 from asynctest import MagicMock, Mock, CoroutineMock
-from zmq.asyncio import Context
 from collections import namedtuple
 
 TestApp = namedtuple("TestApp", ["client", "db_pool", "tmpdir", "app", "log_capture"])
@@ -53,10 +52,10 @@ def dummy_zmq_server(monkeypatch):
 
     """
     dummy = Mock()
-    dummy.return_value.socket.return_value.recv_json = CoroutineMock()
+    dummy.return_value.recv_json = CoroutineMock()
 
-    monkeypatch.setattr(zmq.asyncio.Context, "instance", dummy)
-    yield dummy.return_value.socket.return_value.recv_json
+    monkeypatch.setattr(FlowmachineConnection, "socket_for_request", dummy)
+    yield dummy.return_value.recv_json
 
 
 @pytest.fixture
@@ -99,3 +98,4 @@ async def app(monkeypatch, tmpdir, dummy_db_pool, json_log):
         yield TestApp(
             current_app.test_client(), dummy_db_pool, tmpdir, current_app, json_log
         )
+    await current_app.shutdown()
@@ -0,0 +1,205 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+import asyncio
+import json
+
+import pytest
+import zmq
+from asynctest import Mock
+
+from flowapi.flowmachine_connection import FlowmachineConnection
+
+
+@pytest.fixture
+def dummy_socket(monkeypatch):
+    """
+    Replaces the zmq context with a mock, and yields the mock socket it creates.
+    Replies can be put on the socket's `replies` queue to be received.
+    """
+    dummy_socket = Mock()
+    dummy_socket.closed = False
+    dummy_socket.replies = asyncio.Queue()
+    dummy_socket.recv_multipart = dummy_socket.replies.get
+    dummy_context = Mock()
+    dummy_context.socket.return_value = dummy_socket
+    monkeypatch.setattr(zmq.asyncio.Context, "instance", lambda: dummy_context)
+    yield dummy_socket
+    dummy_context.socket.assert_called_once_with(zmq.DEALER)
+
+
+def get_message_ids(dummy_socket):
+    """
+    Get the routing frames of all messages sent on the dummy socket.
+    """
+    return [
+        sent_call[0][0][0] for sent_call in dummy_socket.send_multipart.call_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replies_matched_to_requests(dummy_socket):
+    """
+    Test that replies are returned to the request that sent the matching message,
+    regardless of the order in which they arrive.
+    """
+    replies = dummy_socket.replies
+
+    connection = FlowmachineConnection(host="localhost", port=5555, logger=Mock())
+    first_socket = connection.socket_for_request()
+    second_socket = connection.socket_for_request()
+    first_socket.send_json({"request_id": "FIRST"})
+    second_socket.send_json({"request_id": "SECOND"})
+
+    (first_call, second_call) = dummy_socket.send_multipart.call_args_list
+    first_id, _, first_msg = first_call[0][0]
+    second_id, _, second_msg = second_call[0][0]
+    assert json.loads(first_msg) == {"request_id": "FIRST"}
+    assert json.loads(second_msg) == {"request_id": "SECOND"}
+
+    await replies.put([second_id, b"", b'{"reply": "SECOND"}'])
+    await replies.put([first_id, b"", b'{"reply": "FIRST"}'])
+    assert await first_socket.recv_json() == {"reply": "FIRST"}
+    assert await second_socket.recv_json() == {"reply": "SECOND"}
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_malformed_reply_does_not_stop_replies(dummy_socket):
+    """
+    Test that a reply which isn't valid JSON fails only the request it answers,
+    and that replies to other requests are still received.
+    """
+    logger = Mock()
+    connection = FlowmachineConnection(host="localhost", port=5555, logger=logger)
+    first_socket = connection.socket_for_request()
+    second_socket = connection.socket_for_request()
+    first_socket.send_json({"request_id": "FIRST"})
+    second_socket.send_json({"request_id": "SECOND"})
+    first_id, second_id = get_message_ids(dummy_socket)
+
+    await dummy_socket.replies.put([b"NOT_A_MESSAGE_ID", b"", b"{}"])
+    await dummy_socket.replies.put([first_id, b"", b"NOT_JSON"])
+    await dummy_socket.replies.put([second_id, b"", b'{"reply": "SECOND"}'])
+    with pytest.raises(ValueError):
+        await first_socket.recv_json()
+    assert await second_socket.recv_json() == {"reply": "SECOND"}
+    assert logger.error.call_count == 2
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_recv_json_times_out(dummy_socket):
+    """
+    Test that waiting for a reply which never arrives times out.
+    """
+    connection = FlowmachineConnection(
+        host="localhost", port=5555, logger=Mock(), reply_timeout=0.01
+    )
+    socket = connection.socket_for_request()
+    socket.send_json({"request_id": "DUMMY_ID"})
+    with pytest.raises(asyncio.TimeoutError):
+        await socket.recv_json()
+    await asyncio.sleep(0)  # Let the reply future's done callbacks run
+    assert connection._pending_replies == {}
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_requests_failed_when_socket_closed(dummy_socket):
+    """
+    Test that requests still awaiting replies fail when replies stop being received.
+    """
+
+    async def recv_from_closed_socket():
+        dummy_socket.closed = True
+        raise zmq.ZMQError()
+
+    dummy_socket.recv_multipart = recv_from_closed_socket
+    connection = FlowmachineConnection(host="localhost", port=5555, logger=Mock())
+    socket = connection.socket_for_request()
+    socket.send_json({"request_id": "DUMMY_ID"})
+    with pytest.raises(ConnectionError):
+        await socket.recv_json()
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_send_error_fails_request(dummy_socket):
+    """
+    Test that a request fails if its message could not be sent.
+    """
+    sent = asyncio.get_event_loop().create_future()
+    dummy_socket.send_multipart.return_value = sent
+    connection = FlowmachineConnection(host="localhost", port=5555, logger=Mock())
+    socket = connection.socket_for_request()
+    socket.send_json({"request_id": "DUMMY_ID"})
+    sent.set_exception(zmq.ZMQError())
+    with pytest.raises(zmq.ZMQError):
+        await socket.recv_json()
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_requests_failed_when_context_terminated(dummy_socket):
+    """
+    Test that requests still awaiting replies fail if the socket's context is
+    terminated, and that receiving is not retried.
+    """
+    recv_multipart = Mock(side_effect=zmq.ZMQError(zmq.ETERM))
+
+    async def recv_from_terminated_context():
+        recv_multipart()
+
+    dummy_socket.recv_multipart = recv_from_terminated_context
+    connection = FlowmachineConnection(host="localhost", port=5555, logger=Mock())
+    socket = connection.socket_for_request()
+    socket.send_json({"request_id": "DUMMY_ID"})
+    with pytest.raises(ConnectionError):
+        await socket.recv_json()
+    recv_multipart.assert_called_once_with()
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_retried_after_error(dummy_socket, monkeypatch):
+    """
+    Test that receiving is retried, after waiting, following an error which
+    doesn't make the socket unusable.
+    """
+    errors = [zmq.ZMQError(zmq.EAGAIN)]
+
+    async def recv_after_error():
+        if errors:
+            raise errors.pop()
+        return await dummy_socket.replies.get()
+
+    dummy_socket.recv_multipart = recv_after_error
+    monkeypatch.setattr(FlowmachineConnection, "receive_retry_interval", 0.01)
+    logger = Mock()
+    connection = FlowmachineConnection(host="localhost", port=5555, logger=logger)
+    socket = connection.socket_for_request()
+    socket.send_json({"request_id": "DUMMY_ID"})
+    (message_id,) = get_message_ids(dummy_socket)
+    await dummy_socket.replies.put([message_id, b"", b'{"reply": "DUMMY"}'])
+    assert await socket.recv_json() == {"reply": "DUMMY"}
+    logger.error.assert_called_once()
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_recv_json_before_send_json(dummy_socket):
+    """
+    Test that receiving before a message has been sent is an error.
+    """
+    connection = FlowmachineConnection(host="localhost", port=5555, logger=Mock())
+    socket = connection.socket_for_request()
+    with pytest.raises(RuntimeError, match="recv_json called before send_json"):
+        await socket.recv_json()
+    socket.send_json({"request_id": "DUMMY_ID"})
+    (message_id,) = get_message_ids(dummy_socket)
+    await dummy_socket.replies.put([message_id, b"", b'{"reply": "DUMMY"}'])
+    assert await socket.recv_json() == {"reply": "DUMMY"}
+    with pytest.raises(RuntimeError, match="recv_json called before send_json"):
+        await socket.recv_json()
+    connection.close()
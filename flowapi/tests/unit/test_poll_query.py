@@ -86,6 +86,39 @@ async def test_poll_query(
         assert "/api/0/get/DUMMY_QUERY_ID" == response.headers["Location"]
 
 
+@pytest.mark.asyncio
+async def test_poll_query_completed_redirect(
+    app, access_token_builder, dummy_zmq_server
+):
+    """
+    Test that polling a completed query redirects to the URL for getting its result.
+    """
+    token = access_token_builder(
+        ["get_result&modal_location.aggregation_unit.DUMMY_AGGREGATION"]
+    )
+    dummy_zmq_server.side_effect = return_once(
+        ZMQReply(
+            status="success",
+            payload={
+                "query_id": "DUMMY_QUERY_ID",
+                "query_params": {
+                    "query_kind": "modal_location",
+                    "aggregation_unit": "DUMMY_AGGREGATION",
+                },
+            },
+        ),
+        then=ZMQReply(
+            status="success",
+            payload={"query_id": "DUMMY_QUERY_ID", "query_state": "completed"},
+        ),
+    )
+    response = await app.client.get(
+        f"/api/0/poll/DUMMY_QUERY_ID", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 303
+    assert "/api/0/get/DUMMY_QUERY_ID" == response.headers["Location"]
+
+
 @pytest.mark.asyncio
 async def test_poll_query_query_error(app, access_token_builder, dummy_zmq_server):
     """
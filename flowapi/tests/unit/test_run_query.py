@@ -7,10 +7,20 @@ from tests.unit.zmq_helpers import ZMQReply
 import pytest
 
 
+@pytest.mark.parametrize(
+    "query_id, location",
+    [
+        ("DUMMY_QUERY_ID", "/api/0/poll/DUMMY_QUERY_ID"),
+        ("DUMMY QUERY/ID?é", "/api/0/poll/DUMMY%20QUERY/ID%3F%C3%A9"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_post_query(app, dummy_zmq_server, access_token_builder):
+async def test_post_query(
+    query_id, location, app, dummy_zmq_server, access_token_builder
+):
     """
-    Test that correct status of 202 & redirect is returned when sending a query.
+    Test that correct status of 202 & redirect is returned when sending a query,
+    with the query id quoted in the redirect URL in the same way as url_for.
     """
 
     token = access_token_builder(
@@ -20,7 +30,7 @@ async def test_post_query(app, dummy_zmq_server, access_token_builder):
         ]
     )
     dummy_zmq_server.return_value = ZMQReply(
-        status="success", payload={"query_id": "DUMMY_QUERY_ID"}
+        status="success", payload={"query_id": query_id}
     )
     response = await app.client.post(
         f"/api/0/run",
@@ -32,7 +42,7 @@ async def test_post_query(app, dummy_zmq_server, access_token_builder):
         },
     )
     assert response.status_code == 202
-    assert "/api/0/poll/DUMMY_QUERY_ID" == response.headers["Location"]
+    assert location == response.headers["Location"]
 
 
 @pytest.mark.parametrize(
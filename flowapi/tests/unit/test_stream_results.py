@@ -0,0 +1,37 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from json import loads
+
+import pytest
+from asynctest import Mock
+
+from flowapi.stream_results import stream_result_as_json
+
+
+@pytest.mark.asyncio
+async def test_stream_result_as_json_in_chunks(monkeypatch, dummy_db_pool):
+    """
+    Test that stream_result_as_json streams valid JSON containing every row when
+    the number of rows is more than (and not a multiple of) the chunk size.
+    """
+    rows = [{"row": i} for i in range(5)]
+    dummy_db_pool.acquire.return_value.__aenter__.return_value.cursor.return_value.__aiter__.return_value = (
+        rows
+    )
+    monkeypatch.setattr(
+        "flowapi.stream_results.current_app", Mock(db_conn_pool=dummy_db_pool)
+    )
+    monkeypatch.setattr("flowapi.stream_results.request", Mock(request_id="DUMMY_ID"))
+
+    chunks = [
+        chunk
+        async for chunk in stream_result_as_json(
+            "SELECT 1;", additional_elements={"query_id": "DUMMY_ID"}, chunk_size=2
+        )
+    ]
+
+    # Opening of the JSON, three chunks of rows, and end of the JSON
+    assert len(chunks) == 5
+    assert {"query_id": "DUMMY_ID", "query_result": rows} == loads(b"".join(chunks))
@@ -1,14 +1,13 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
-import binhex
-
 import base64
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.backends.openssl.rsa import _RSAPrivateKey
 from cryptography.hazmat.primitives import serialization
 from dogpile.cache import make_region, CacheRegion
+from functools import lru_cache
 from multiprocessing import Event
 
 from get_secret_or_env_var import environ, getenv
@@ -59,6 +58,7 @@ def get_cache_backend() -> CacheRegion:
 
 # Duplicated in flowkit_jwt_generator (cannot re-use the implementation
 # there because the module is outside the docker build context for flowauth).
+@lru_cache(maxsize=4)
 def load_private_key(key_string: str) -> _RSAPrivateKey:
     """
     Load a private key from a string, which may be base64 encoded.
@@ -72,22 +72,58 @@ def load_private_key(key_string: str) -> _RSAPrivateKey:
     -------
     _RSAPrivateKey
         The private key
+
+    Notes
+    -----
+    Loaded keys are cached, so that repeatedly creating the app doesn't
+    repeatedly parse the same key.
     """
+    key_bytes = key_string.encode()
     try:
         return serialization.load_pem_private_key(
-            key_string.encode(), password=None, backend=default_backend()
+            key_bytes, password=None, backend=default_backend()
         )
     except ValueError:
-        try:
-            return load_private_key(base64.b64decode(key_string).decode())
-        except (binhex.Error, ValueError):
-            raise ValueError("Failed to load private key.")
+        pass
+    # Not a PEM-encoded key, so try decoding it as base64 first
+    try:
+        return serialization.load_pem_private_key(
+            base64.b64decode(key_bytes), password=None, backend=default_backend()
+        )
+    except ValueError:  # Includes binascii.Error, raised for invalid base64
+        raise ValueError("Failed to load private key.")
+
+
+@lru_cache(maxsize=4)
+def validate_fernet_key(fernet_key: bytes) -> bytes:
+    """
+    Check that a key is a valid fernet key. Results are cached, so that
+    repeatedly creating the app doesn't repeatedly validate the same key.
+
+    Parameters
+    ----------
+    fernet_key : bytes
+        Key to validate
+
+    Returns
+    -------
+    bytes
+        The key
+
+    Raises
+    ------
+    ValueError
+        If the key is not a valid fernet key
+    """
+    _ = Fernet(fernet_key)  # Error if fernet key is bad
+    return fernet_key
 
 
 def get_config():
     try:
-        flowauth_fernet_key = environ["FLOWAUTH_FERNET_KEY"].encode()
-        _ = Fernet(flowauth_fernet_key)  # Error if fernet key is bad
+        flowauth_fernet_key = validate_fernet_key(
+            environ["FLOWAUTH_FERNET_KEY"].encode()
+        )
         log_level = getattr(
             logging, getenv("FLOWAUTH_LOG_LEVEL", "error").upper(), logging.ERROR
         )
@@ -5,7 +5,6 @@ from flask import Blueprint, jsonify, request
 
 from flask_login import login_required
 from flask_principal import Permission, RoleNeed
-from sqlalchemy.orm.exc import NoResultFound
 
 from .invalid_usage import InvalidUsage
 from .models import *
@@ -70,17 +69,20 @@ def edit_server_capabilities(server_id):
     server_obj = Server.query.filter_by(id=server_id).first_or_404()
     json = request.get_json()
 
-    to_remove = (x for x in server_obj.capabilities if x.capability not in json)
+    # Look up all of the server's existing capabilities at once, rather than
+    # querying for each capability in turn
+    existing_caps = {cap.capability: cap for cap in server_obj.capabilities}
+    to_remove = [
+        cap for capability, cap in existing_caps.items() if capability not in json
+    ]
     current_app.logger.debug(
         "Editing capabilities for server", server_id=server_obj, new_permissions=json
     )
-    for cap, enabled in json.items():
+    for capability, enabled in json.items():
         try:
-            cap = ServerCapability.query.filter_by(
-                server_id=server_id, capability=cap
-            ).one()
-        except NoResultFound:
-            cap = ServerCapability(server=server_obj, capability=cap)
+            cap = existing_caps[capability]
+        except KeyError:
+            cap = ServerCapability(server=server_obj, capability=capability)
         cap.enabled = enabled
         db.session.add(cap)
 
@@ -0,0 +1,81 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+import base64
+
+import pytest
+from cryptography.fernet import Fernet
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from flowauth.config import load_private_key, validate_fernet_key
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    """
+    An RSA private key, generated once for the tests in this module.
+    """
+    return rsa.generate_private_key(
+        public_exponent=65537, key_size=2048, backend=default_backend()
+    )
+
+
+@pytest.fixture(scope="module")
+def private_key_pem(private_key):
+    """
+    PEM string of the private key.
+    """
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+def test_load_private_key_from_pem(private_key, private_key_pem):
+    """
+    Test that a PEM-encoded private key can be loaded.
+    """
+    loaded_key = load_private_key(private_key_pem)
+    assert loaded_key.private_numbers() == private_key.private_numbers()
+    # Loaded keys are cached
+    assert load_private_key(private_key_pem) is loaded_key
+
+
+def test_load_private_key_from_base64_pem(private_key, private_key_pem):
+    """
+    Test that a base64-encoded PEM private key can be loaded.
+    """
+    loaded_key = load_private_key(base64.b64encode(private_key_pem.encode()).decode())
+    assert loaded_key.private_numbers() == private_key.private_numbers()
+
+
+@pytest.mark.parametrize(
+    "key_string",
+    ["NOT_A_KEY", base64.b64encode(b"NOT_A_KEY").decode()],
+    ids=["not_base64", "base64_not_pem"],
+)
+def test_load_private_key_invalid(key_string):
+    """
+    Test that trying to load an invalid private key raises a ValueError.
+    """
+    with pytest.raises(ValueError, match="Failed to load private key."):
+        load_private_key(key_string)
+
+
+def test_validate_fernet_key():
+    """
+    Test that validate_fernet_key returns a valid fernet key.
+    """
+    fernet_key = Fernet.generate_key()
+    assert validate_fernet_key(fernet_key) == fernet_key
+
+
+def test_validate_fernet_key_invalid():
+    """
+    Test that validate_fernet_key raises a ValueError for an invalid fernet key.
+    """
+    with pytest.raises(ValueError):
+        validate_fernet_key(b"NOT_A_FERNET_KEY")
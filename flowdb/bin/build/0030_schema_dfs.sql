@@ -48,6 +48,9 @@ CREATE SCHEMA IF NOT EXISTS dfs;
 
         );
 
+    CREATE INDEX IF NOT EXISTS dfs_transactions_timestamp_index
+        ON dfs.transactions (timestamp);
+
     CREATE TABLE IF NOT EXISTS dfs.subscribers(
 
         id     BIGSERIAL PRIMARY KEY,
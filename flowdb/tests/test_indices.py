@@ -61,3 +61,18 @@ def query(cursor, infrastructure_table):
 def test_infrastructure_index(query, expected_index):
     """infrastructure.* tables contain spatial indices."""
     assert expected_index in query
+
+
+def test_dfs_transactions_timestamp_index(cursor):
+    """dfs.transactions has an index on the transaction timestamp."""
+    cursor.execute(
+        """
+    SELECT
+        *
+    FROM pg_indexes
+    WHERE schemaname = 'dfs' AND
+          tablename = 'transactions';
+    """
+    )
+    results = [i["indexname"] for i in cursor.fetchall()]
+    assert "dfs_transactions_timestamp_index" in results
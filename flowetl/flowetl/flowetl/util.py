@@ -41,12 +41,13 @@ def get_qa_checks(*, dag: Optional["DAG"] = None) -> List["QACheckOperator"]:
         str(default_checks),
     ]
     jinja_env = dag.get_template_env()
-    templates = [
+    # Generate the candidate templates lazily, so they are filtered in one pass
+    templates = (
         Path(tmpl)
         for tmpl in jinja_env.list_templates(
             filter_func=lambda tmpl: "qa_checks" in tmpl and tmpl.endswith(".sql")
         )
-    ]
+    )
     valid_stems = (
         "qa_checks",
         *((dag.params["cdr_type"],) if "cdr_type" in dag.params else ()),
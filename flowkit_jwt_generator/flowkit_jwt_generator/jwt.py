@@ -36,15 +36,20 @@ def load_private_key(key_string: str) -> _RSAPrivateKey:
     _RSAPrivateKey
         The private key
     """
+    key_bytes = key_string.encode()
     try:
         return serialization.load_pem_private_key(
-            key_string.encode(), password=None, backend=default_backend()
+            key_bytes, password=None, backend=default_backend()
         )
     except ValueError:
-        try:
-            return load_private_key(base64.b64decode(key_string).decode())
-        except (binascii.Error, ValueError):
-            raise ValueError("Failed to load key.")
+        pass
+    # Not a PEM-encoded key, so try decoding it as base64 first
+    try:
+        return serialization.load_pem_private_key(
+            base64.b64decode(key_bytes), password=None, backend=default_backend()
+        )
+    except ValueError:  # Includes binascii.Error, raised for invalid base64
+        raise ValueError("Failed to load key.")
 
 
 # Duplicated in FlowAPI (cannot use this implementation there because
@@ -167,11 +167,11 @@ def write_cache_metadata(
     self_storage = b""
 
     try:
-        in_cache = bool(
-            connection.fetch(
-                f"SELECT * FROM cache.cached WHERE query_id='{query.query_id}'"
-            )
-        )
+        # Only check for the record, rather than fetching it (which would
+        # include the pickled query object)
+        in_cache = connection.fetch(
+            f"SELECT EXISTS(SELECT 1 FROM cache.cached WHERE query_id='{query.query_id}')"
+        )[0][0]
         if not in_cache:
             try:
                 self_storage = pickle.dumps(query)
@@ -201,10 +201,15 @@ def write_cache_metadata(
             con.execute("SELECT touch_cache(%s);", query.query_id)
 
             if not in_cache:
-                for dep in query._get_stored_dependencies(exclude_self=True):
+                dependency_ids = [
+                    dep.query_id
+                    for dep in query._get_stored_dependencies(exclude_self=True)
+                ]
+                if dependency_ids:
+                    # Record all dependencies in a single statement
                     con.execute(
-                        "INSERT INTO cache.dependencies values (%s, %s) ON CONFLICT DO NOTHING",
-                        (query.query_id, dep.query_id),
+                        "INSERT INTO cache.dependencies SELECT %s, unnest(%s::text[]) ON CONFLICT DO NOTHING",
+                        (query.query_id, dependency_ids),
                     )
                 logger.debug(f"{query.fully_qualified_table_name} added to cache.")
             else:
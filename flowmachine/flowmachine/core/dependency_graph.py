@@ -214,6 +214,9 @@ def unstored_dependencies_graph(query_obj: "Query") -> nx.DiGraph:
     used in the actual running of a query, only to be referenced by it.
     """
     deps = []
+    # Queries shared by several dependencies only need to be checked (and have
+    # their own dependencies added) once.
+    stored_statuses = {}
 
     if not query_obj.is_stored:
         openlist = list(
@@ -225,14 +228,19 @@ def unstored_dependencies_graph(query_obj: "Query") -> nx.DiGraph:
             if y is query_obj:
                 # We don't want to include this query in the graph, only its dependencies.
                 y = None
-            # Wait for query to complete before checking whether it's stored.
-            q_state_machine = QueryStateMachine(
-                get_redis(), x.query_id, get_db().conn_id
-            )
-            q_state_machine.wait_until_complete()
-            if not x.is_stored:
+            try:
+                x_is_stored = stored_statuses[x.query_id]
+            except KeyError:
+                # Wait for query to complete before checking whether it's stored.
+                q_state_machine = QueryStateMachine(
+                    get_redis(), x.query_id, get_db().conn_id
+                )
+                q_state_machine.wait_until_complete()
+                x_is_stored = stored_statuses[x.query_id] = x.is_stored
+                if not x_is_stored:
+                    openlist += list(zip([x] * len(x.dependencies), x.dependencies))
+            if not x_is_stored:
                 deps.append((y, x))
-                openlist += list(zip([x] * len(x.dependencies), x.dependencies))
 
     def get_node_attrs(q):
         attrs = {}
@@ -326,8 +334,9 @@ def store_queries_in_order(dependency_graph: nx.DiGraph) -> Dict[str, "Future"]:
     dict
         Mapping from query nodes to Future objects representing the store tasks
     """
-    ordered_list_of_queries = list(nx.topological_sort(dependency_graph))[::-1]
-    logger.debug(f"Storing queries with IDs: {ordered_list_of_queries}")
+    ordered_list_of_queries = list(nx.topological_sort(dependency_graph))
+    ordered_list_of_queries.reverse()
+    logger.debug("Storing queries", query_ids=ordered_list_of_queries)
     store_futures = {}
     for query in ordered_list_of_queries:
         try:
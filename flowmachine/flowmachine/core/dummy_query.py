@@ -9,7 +9,7 @@ import structlog
 
 from .context import get_redis, get_db
 from .query import Query
-from .query_state import QueryStateMachine
+from .query_state import QueryState, QueryStateMachine
 
 logger = structlog.get_logger("flowmachine.debug", submodule=__name__)
 
@@ -40,10 +40,12 @@ class DummyQuery(Query):
         """
         Determine dummy 'stored' status from redis, instead of checking the database.
         """
-        q_state_machine = QueryStateMachine(
+        # Look up the state without creating (and, for a new query, populating)
+        # a state machine just to check it.
+        state = QueryStateMachine.lookup_query_state(
             get_redis(), self.query_id, get_db().conn_id
         )
-        return q_state_machine.is_completed
+        return state == QueryState.COMPLETED
 
     def store(self, store_dependencies=False):
         logger.debug(
@@ -12,7 +12,7 @@ so we also define the helper function location_joined_query
 to return a JoinToLocation object if a join is required, or
 the original query object otherwise.
 """
-from typing import List, Union
+from typing import List, Tuple, Union
 
 from .query import Query
 from .spatial_unit import SpatialUnitMixin, AnySpatialUnit, GeomSpatialUnit
@@ -71,21 +71,33 @@ class JoinToLocation(Query):
         except AttributeError:
             return self.spatial_unit.__getattribute__(name)
 
+    @property
+    def _left_and_right_columns(self) -> Tuple[List[str], List[str]]:
+        """
+        Columns from the left query (excluding any that will be provided by the
+        spatial unit) and from the spatial unit. Calculated once, since both
+        column_names and _make_query need them.
+        """
+        try:
+            return self._joined_columns
+        except AttributeError:
+            right_columns = list(self.spatial_unit.location_id_columns)
+            right_columns_set = set(right_columns)
+            left_columns = [
+                column
+                for column in self.left.column_names
+                if column not in right_columns_set
+            ]
+            self._joined_columns = (left_columns, right_columns)
+            return self._joined_columns
+
     @property
     def column_names(self) -> List[str]:
-        right_columns = self.spatial_unit.location_id_columns
-        left_columns = self.left.column_names
-        for column in right_columns:
-            if column in left_columns:
-                left_columns.remove(column)
+        left_columns, right_columns = self._left_and_right_columns
         return left_columns + right_columns
 
     def _make_query(self):
-        right_columns = self.spatial_unit.location_id_columns
-        left_columns = self.left.column_names
-        for column in right_columns:
-            if column in left_columns:
-                left_columns.remove(column)
+        left_columns, right_columns = self._left_and_right_columns
 
         right_columns_str = ", ".join([f"sites.{c}" for c in right_columns])
         left_columns_str = ", ".join([f"l.{c}" for c in left_columns])
@@ -109,6 +121,22 @@ class JoinToLocation(Query):
 
         return sql
 
+    def __getstate__(self):
+        """
+        Removes properties which should not be pickled, or hashed. Override
+        this method in your subclass if you need to add more.
+
+        Overridden to remove the stored column lists.
+
+        Returns
+        -------
+        dict
+            A picklable and hash-safe copy of this objects internal dict.
+        """
+        state = super().__getstate__()
+        state.pop("_joined_columns", None)
+        return state
+
 
 def location_joined_query(
     left: Query, *, spatial_unit: AnySpatialUnit, time_col: str = "time"
@@ -12,7 +12,7 @@ import logging
 from enum import Enum
 
 from finist import Finist
-from typing import Tuple
+from typing import Optional, Tuple
 
 from redis import StrictRedis
 
@@ -103,9 +103,9 @@ class QueryStateMachine:
 
     def __init__(self, redis_client: StrictRedis, query_id: str, db_id: str):
         self.query_id = query_id
-        must_populate = redis_client.get(f"finist:{db_id}:{query_id}-state") is None
+        must_populate = self.lookup_query_state(redis_client, query_id, db_id) is None
         self.state_machine = Finist(
-            redis_client, f"{db_id}:{query_id}-state", QueryState.KNOWN
+            redis_client, self._state_machine_name(query_id, db_id), QueryState.KNOWN
         )
         if must_populate:  # Need to create the state machine for this query
             self.state_machine.on(QueryEvent.QUEUE, QueryState.KNOWN, QueryState.QUEUED)
@@ -140,6 +140,38 @@ class QueryStateMachine:
                 QueryEvent.FINISH_RESET, QueryState.RESETTING, QueryState.KNOWN
             )
 
+    @staticmethod
+    def _state_machine_name(query_id: str, db_id: str) -> str:
+        """
+        Name of the finist state machine which tracks a query's state.
+        """
+        return f"{db_id}:{query_id}-state"
+
+    @classmethod
+    def lookup_query_state(
+        cls, redis_client: StrictRedis, query_id: str, db_id: str
+    ) -> Optional[QueryState]:
+        """
+        Get the current state of a query without creating a state machine
+        for it, so redis is left untouched if the query is not yet known.
+
+        Parameters
+        ----------
+        redis_client : StrictRedis
+            Client for redis
+        query_id : str
+            Unique query identifier
+        db_id : str
+            FlowDB connection id
+
+        Returns
+        -------
+        QueryState or None
+            Current state of the query, or None if redis has no state machine for it
+        """
+        state = redis_client.get(f"finist:{cls._state_machine_name(query_id, db_id)}")
+        return None if state is None else QueryState(state.decode())
+
     @property
     def current_query_state(self) -> QueryState:
         """
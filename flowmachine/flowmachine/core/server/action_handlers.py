@@ -38,6 +38,10 @@ from .zmq_helpers import ZMQReply
 
 __all__ = ["perform_action"]
 
+# Schemas hold no per-request state, so build them once rather than per action
+_flowmachine_query_schema = FlowmachineQuerySchema()
+_geography_schema = GeographySchema()
+
 
 async def action_handler__ping(config: "FlowmachineServerConfig") -> ZMQReply:
     """
@@ -84,7 +88,7 @@ async def action_handler__run_query(
     parameters needed to construct the query.
     """
     try:
-        query_obj = FlowmachineQuerySchema().load(action_params)
+        query_obj = _flowmachine_query_schema.load(action_params)
     except TypeError as exc:
         # We need to catch TypeError here, otherwise they propagate up to
         # perform_action() and result in a very misleading error message.
@@ -290,7 +294,7 @@ async def action_handler__get_geography(
     Returns SQL to get geography for the given `aggregation_unit` as GeoJSON.
     """
     try:
-        query_obj = GeographySchema().load({"aggregation_unit": aggregation_unit})
+        query_obj = _geography_schema.load({"aggregation_unit": aggregation_unit})
     except TypeError as exc:
         # We need to catch TypeError here, otherwise they propagate up to
         # perform_action() and result in a very misleading error message.
@@ -67,4 +67,10 @@ class BaseExposedQuery(metaclass=ABCMeta):
         # However, the resulting md5 hash is different from the one produced internally
         # by flowmachine.core.Query.query_id, and the latter is currently being used by
         # the QueryStateMachine, so we need to use it to check the query state.
-        return self._flowmachine_query_obj.query_id
+        try:
+            return self._query_id
+        except AttributeError:
+            # Each access of _flowmachine_query_obj constructs a new query object,
+            # so only do it once. Exposed queries are not modified after creation.
+            self._query_id = self._flowmachine_query_obj.query_id
+            return self._query_id
@@ -59,24 +59,27 @@ class MeaningfulLocationsAggregateSchema(Schema):
         return MeaningfulLocationsAggregateExposed(**params)
 
 
-def _make_meaningful_locations_object(
+def _make_clusters_and_scores(
     *,
     start_date,
     end_date,
-    label,
-    labels,
     subscriber_subset,
     tower_cluster_call_threshold,
     tower_cluster_radius,
     tower_day_of_week_scores,
     tower_hour_of_day_scores,
 ):
+    """
+    Create the HartiganCluster and EventScore queries which meaningful locations
+    are derived from. These don't depend on the label, so can be shared between
+    meaningful locations queries for different labels.
+    """
+    # note this 'spatial_unit' is not the same as the exposed parameter 'aggregation_unit'
+    spatial_unit = make_spatial_unit("versioned-site")
     q_subscriber_locations = SubscriberLocations(
         start=start_date,
         stop=end_date,
-        spatial_unit=make_spatial_unit(
-            "versioned-site"
-        ),  # note this 'spatial_unit' is not the same as the exposed parameter 'aggregation_unit'
+        spatial_unit=spatial_unit,
         subscriber_subset=subscriber_subset,
     )
     q_call_days = CallDays(subscriber_locations=q_subscriber_locations)
@@ -91,11 +94,16 @@ def _make_meaningful_locations_object(
         stop=end_date,
         score_hour=tower_hour_of_day_scores,
         score_dow=tower_day_of_week_scores,
-        spatial_unit=make_spatial_unit(
-            "versioned-site"
-        ),  # note this 'spatial_unit' is not the same as the exposed parameter 'aggregation_unit'
+        spatial_unit=spatial_unit,
         subscriber_subset=subscriber_subset,
     )
+    return q_hartigan_cluster, q_event_score
+
+
+def _make_meaningful_locations_object(*, label, labels, **clusters_and_scores_params):
+    q_hartigan_cluster, q_event_score = _make_clusters_and_scores(
+        **clusters_and_scores_params
+    )
     q_meaningful_locations = MeaningfulLocations(
         clusters=q_hartigan_cluster, labels=labels, scores=q_event_score, label=label
     )
@@ -130,24 +138,6 @@ class MeaningfulLocationsAggregateExposed(BaseExposedQuery):
         self.tower_cluster_call_threshold = tower_cluster_call_threshold
         self.subscriber_subset = subscriber_subset
 
-        q_meaningful_locations = _make_meaningful_locations_object(
-            label=label,
-            labels=labels,
-            start_date=start_date,
-            end_date=end_date,
-            subscriber_subset=subscriber_subset,
-            tower_cluster_call_threshold=tower_cluster_call_threshold,
-            tower_cluster_radius=tower_cluster_radius,
-            tower_day_of_week_scores=tower_day_of_week_scores,
-            tower_hour_of_day_scores=tower_hour_of_day_scores,
-        )
-        self.q_meaningful_locations_aggregate = RedactedMeaningfulLocationsAggregate(
-            meaningful_locations_aggregate=MeaningfulLocationsAggregate(
-                meaningful_locations=q_meaningful_locations,
-                spatial_unit=get_spatial_unit_obj(aggregation_unit),
-            )
-        )
-
     @property
     def _flowmachine_query_obj(self):
         """
@@ -155,9 +145,32 @@ class MeaningfulLocationsAggregateExposed(BaseExposedQuery):
 
         Returns
         -------
-        ModalLocation
+        RedactedMeaningfulLocationsAggregate
         """
-        return self.q_meaningful_locations_aggregate
+        try:
+            return self._query_obj
+        except AttributeError:
+            # Constructing the flowmachine object graph is relatively expensive,
+            # so only do it once. Exposed queries are not modified after creation.
+            pass
+        q_meaningful_locations = _make_meaningful_locations_object(
+            label=self.label,
+            labels=self.labels,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            subscriber_subset=self.subscriber_subset,
+            tower_cluster_call_threshold=self.tower_cluster_call_threshold,
+            tower_cluster_radius=self.tower_cluster_radius,
+            tower_day_of_week_scores=self.tower_day_of_week_scores,
+            tower_hour_of_day_scores=self.tower_hour_of_day_scores,
+        )
+        self._query_obj = RedactedMeaningfulLocationsAggregate(
+            meaningful_locations_aggregate=MeaningfulLocationsAggregate(
+                meaningful_locations=q_meaningful_locations,
+                spatial_unit=get_spatial_unit_obj(self.aggregation_unit),
+            )
+        )
+        return self._query_obj
 
 
 class MeaningfulLocationsBetweenLabelODMatrixSchema(Schema):
@@ -213,27 +226,6 @@ class MeaningfulLocationsBetweenLabelODMatrixExposed(BaseExposedQuery):
         self.tower_cluster_call_threshold = tower_cluster_call_threshold
         self.subscriber_subset = subscriber_subset
 
-        common_params = dict(
-            labels=labels,
-            start_date=start_date,
-            end_date=end_date,
-            subscriber_subset=subscriber_subset,
-            tower_cluster_call_threshold=tower_cluster_call_threshold,
-            tower_cluster_radius=tower_cluster_radius,
-            tower_day_of_week_scores=tower_day_of_week_scores,
-            tower_hour_of_day_scores=tower_hour_of_day_scores,
-        )
-        locs_a = _make_meaningful_locations_object(label=label_a, **common_params)
-        locs_b = _make_meaningful_locations_object(label=label_b, **common_params)
-
-        self.q_meaningful_locations_od = RedactedMeaningfulLocationsOD(
-            meaningful_locations_od=MeaningfulLocationsOD(
-                meaningful_locations_a=locs_a,
-                meaningful_locations_b=locs_b,
-                spatial_unit=get_spatial_unit_obj(aggregation_unit),
-            )
-        )
-
     @property
     def _flowmachine_query_obj(self):
         """
@@ -241,9 +233,42 @@ class MeaningfulLocationsBetweenLabelODMatrixExposed(BaseExposedQuery):
 
         Returns
         -------
-        MeaningfulLocationsOD
+        RedactedMeaningfulLocationsOD
         """
-        return self.q_meaningful_locations_od
+        try:
+            return self._query_obj
+        except AttributeError:
+            pass
+        # Both labels use the same clusters and scores, so only create them once
+        q_hartigan_cluster, q_event_score = _make_clusters_and_scores(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            subscriber_subset=self.subscriber_subset,
+            tower_cluster_call_threshold=self.tower_cluster_call_threshold,
+            tower_cluster_radius=self.tower_cluster_radius,
+            tower_day_of_week_scores=self.tower_day_of_week_scores,
+            tower_hour_of_day_scores=self.tower_hour_of_day_scores,
+        )
+        locs_a = MeaningfulLocations(
+            clusters=q_hartigan_cluster,
+            labels=self.labels,
+            scores=q_event_score,
+            label=self.label_a,
+        )
+        locs_b = MeaningfulLocations(
+            clusters=q_hartigan_cluster,
+            labels=self.labels,
+            scores=q_event_score,
+            label=self.label_b,
+        )
+        self._query_obj = RedactedMeaningfulLocationsOD(
+            meaningful_locations_od=MeaningfulLocationsOD(
+                meaningful_locations_a=locs_a,
+                meaningful_locations_b=locs_b,
+                spatial_unit=get_spatial_unit_obj(self.aggregation_unit),
+            )
+        )
+        return self._query_obj
 
 
 class MeaningfulLocationsBetweenDatesODMatrixSchema(Schema):
@@ -302,28 +327,6 @@ class MeaningfulLocationsBetweenDatesODMatrixExposed(BaseExposedQuery):
         self.tower_cluster_call_threshold = tower_cluster_call_threshold
         self.subscriber_subset = subscriber_subset
 
-        common_params = dict(
-            labels=labels,
-            label=label,
-            subscriber_subset=subscriber_subset,
-            tower_cluster_call_threshold=tower_cluster_call_threshold,
-            tower_cluster_radius=tower_cluster_radius,
-            tower_day_of_week_scores=tower_day_of_week_scores,
-            tower_hour_of_day_scores=tower_hour_of_day_scores,
-        )
-        locs_a = _make_meaningful_locations_object(
-            start_date=start_date_a, end_date=end_date_a, **common_params
-        )
-        locs_b = _make_meaningful_locations_object(
-            start_date=start_date_b, end_date=end_date_b, **common_params
-        )
-
-        self.q_meaningful_locations_od = MeaningfulLocationsOD(
-            meaningful_locations_a=locs_a,
-            meaningful_locations_b=locs_b,
-            spatial_unit=get_spatial_unit_obj(aggregation_unit),
-        )
-
     @property
     def _flowmachine_query_obj(self):
         """
@@ -333,4 +336,28 @@ class MeaningfulLocationsBetweenDatesODMatrixExposed(BaseExposedQuery):
         -------
         MeaningfulLocationsOD
         """
-        return self.q_meaningful_locations_od
+        try:
+            return self._query_obj
+        except AttributeError:
+            pass
+        common_params = dict(
+            labels=self.labels,
+            label=self.label,
+            subscriber_subset=self.subscriber_subset,
+            tower_cluster_call_threshold=self.tower_cluster_call_threshold,
+            tower_cluster_radius=self.tower_cluster_radius,
+            tower_day_of_week_scores=self.tower_day_of_week_scores,
+            tower_hour_of_day_scores=self.tower_hour_of_day_scores,
+        )
+        locs_a = _make_meaningful_locations_object(
+            start_date=self.start_date_a, end_date=self.end_date_a, **common_params
+        )
+        locs_b = _make_meaningful_locations_object(
+            start_date=self.start_date_b, end_date=self.end_date_b, **common_params
+        )
+        self._query_obj = MeaningfulLocationsOD(
+            meaningful_locations_a=locs_a,
+            meaningful_locations_b=locs_b,
+            spatial_unit=get_spatial_unit_obj(self.aggregation_unit),
+        )
+        return self._query_obj
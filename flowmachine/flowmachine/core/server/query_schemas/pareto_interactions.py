@@ -3,7 +3,7 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from marshmallow import fields, post_load
-from marshmallow.validate import OneOf, Length, Range
+from marshmallow.validate import OneOf, Range
 
 from flowmachine.features import ParetoInteractions
 from .custom_fields import SubscriberSubset
@@ -19,7 +19,10 @@ class ParetoInteractionsSchema(BaseQueryWithSamplingSchema):
     query_kind = fields.String(validate=OneOf(["pareto_interactions"]))
     start = fields.Date(required=True)
     stop = fields.Date(required=True)
-    proportion = fields.Float(required=True, validate=Range(min=0.0, max=1.0))
+    proportion = fields.Float(
+        required=True,
+        validate=Range(0.0, 1.0, min_inclusive=False, max_inclusive=False),
+    )
     subscriber_subset = SubscriberSubset()
 
     @post_load
@@ -3,7 +3,7 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from marshmallow import fields, post_load
-from marshmallow.validate import OneOf, Length
+from marshmallow.validate import OneOf
 
 from flowmachine.features import SubscriberDegree
 from .custom_fields import SubscriberSubset
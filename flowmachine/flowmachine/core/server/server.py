@@ -14,7 +14,7 @@ import signal
 import structlog
 import zmq
 from functools import partial
-from typing import NoReturn
+from typing import List, NoReturn
 
 from marshmallow import ValidationError
 from zmq.asyncio import Context
@@ -112,10 +112,15 @@ async def receive_next_zmq_message_and_send_back_reply(
     Listen on the given zmq socket for the next multipart message, .
 
     Note that the only responsibility of this function is to ensure
-    that the incoming zmq message has the expected structure (three
-    parts of the form `return_address, empty_delimiter, msg`) and to
-    send back the reply. The responsibility for actually processing
-    the message and calculating the reply lies with other functions.
+    that the incoming zmq message has the expected structure (of the form
+    `*return_address, empty_delimiter, msg`) and to send back the reply.
+    The responsibility for actually processing the message and calculating
+    the reply lies with other functions.
+
+    The return address is the identity of the sending socket, followed by
+    any routing frames added by the sender (e.g. FlowAPI uses a DEALER
+    socket, and adds a frame identifying each message so that replies can
+    be matched to requests).
 
     Parameters
     ----------
@@ -132,14 +137,14 @@ async def receive_next_zmq_message_and_send_back_reply(
     # Check structural integrity of the zmq multipart message.
     # Ignore it if it doesn't have the expected structure.
     #
-    if len(multipart_msg) != 3:
+    if len(multipart_msg) < 3:
         logger.error(
-            "Multipart message did not contain the expected three parts. Ignoring this message "
+            "Multipart message did not contain at least three parts. Ignoring this message "
             "as it cannot have come from FlowAPI and we cannot determine a return address."
         )
         return
 
-    return_address, empty_delimiter, msg_contents = multipart_msg
+    *return_address, empty_delimiter, msg_contents = multipart_msg
 
     if empty_delimiter != b"":
         logger.error(
@@ -167,7 +172,7 @@ async def receive_next_zmq_message_and_send_back_reply(
 async def calculate_and_send_reply_for_message(
     *,
     socket: "zmq.asyncio.Socket",
-    return_address: bytes,
+    return_address: List[bytes],
     msg_contents: str,
     config: "FlowmachineServerConfig",
 ) -> None:
@@ -180,8 +185,8 @@ async def calculate_and_send_reply_for_message(
     ----------
     socket : zmq.asyncio.Socket
         The zmq socket to use for sending the reply.
-    return_address : bytes
-        The zmq return address to which to send the reply.
+    return_address : list of bytes
+        The zmq return address (routing frames) to which to send the reply.
     msg_contents : str
         JSON string with the message contents.
     config : FlowmachineServerConfig
@@ -198,7 +203,7 @@ async def calculate_and_send_reply_for_message(
         )
         reply_json = ZMQReply(status="error", msg="Could not get reply for message")
     await socket.send_multipart(
-        [return_address, b"", rapidjson.dumps(reply_json).encode()]
+        [*return_address, b"", rapidjson.dumps(reply_json).encode()]
     )
     logger.debug("Sent reply", reply=reply_json, msg=msg_contents)
 
@@ -52,7 +52,8 @@ async def send_zmq_message_and_await_reply(msg, port=5555, host="localhost"):
     print(f"Sending message: {msg}")
     await socket.send_json(msg)
     reply = await socket.recv_json()
-    context.destroy()
+    # Only close this socket, so that other messages can be awaited concurrently
+    socket.close()
     return reply
 
 
@@ -273,7 +273,8 @@ class GeomSpatialUnit(SpatialUnitMixin, Query):
         self._geom_col = geom_column
 
         # Check that _locid_cols is a subset of column_names
-        missing_cols = [c for c in self._locid_cols if not (c in self.column_names)]
+        column_names = frozenset(self.column_names)
+        missing_cols = [c for c in self._locid_cols if c not in column_names]
         if missing_cols:
             raise ValueError(
                 f"Location ID columns {missing_cols} are not in returned columns."
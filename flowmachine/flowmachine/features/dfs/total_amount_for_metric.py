@@ -5,6 +5,36 @@ from flowmachine.core import Query
 from flowmachine.core.date_range import DateRange
 
 
+class _DFSCellMapping(Query):
+    """
+    Maps each version of each cell to the region of the given
+    aggregation unit which contains it. This does not depend on
+    the dates of any DFS query, so can be stored once and reused.
+    """
+
+    def __init__(self, *, aggregation_unit):
+        self.aggregation_unit = aggregation_unit
+        super().__init__()
+
+    @property
+    def column_names(self) -> List[str]:
+        return ["id", "version", "pcod"]
+
+    def _make_query(self):
+        sql = textwrap.dedent(
+            f"""
+            SELECT
+                id,
+                version,
+                {self.aggregation_unit}pcod as pcod
+            FROM infrastructure.cells c
+            JOIN geography.{self.aggregation_unit} a
+            ON ST_Within(c.geom_point, a.geom)
+            """
+        )
+        return sql
+
+
 class DFSTotalMetricAmount(Query):
     """
     Calculates the total amount of a given DFS metric per
@@ -16,6 +46,7 @@ class DFSTotalMetricAmount(Query):
         self.metric = metric
         self.date_range = DateRange(start_date, end_date)
         self.aggregation_unit = aggregation_unit
+        self.cell_mapping = _DFSCellMapping(aggregation_unit=aggregation_unit)
         super().__init__()
 
     @property
@@ -25,34 +56,17 @@ class DFSTotalMetricAmount(Query):
     def _make_query(self):
         sql = textwrap.dedent(
             f"""
-            WITH filtered_transactions AS (
-                SELECT * FROM dfs.transactions
-                WHERE timestamp >= '{self.date_range.start_date_as_str}'::timestamptz
-                AND timestamp < '{self.date_range.one_day_past_end_date_as_str}'::timestamptz
-            ),
-            geolocated_transactions AS (
-                SELECT * FROM filtered_transactions t1
-                JOIN dfs.transactions_metadata t2
-                ON t1.id = t2.transaction_id
-            ),
-            cell_mapping AS (
-                SELECT
-                    id,
-                    version,
-                    site_id,
-                    {self.aggregation_unit}name as name,
-                    {self.aggregation_unit}pcod as pcod
-                FROM infrastructure.cells c
-                JOIN geography.{self.aggregation_unit} a
-                ON ST_Within(c.geom_point, a.geom)
-            )
             SELECT
-                timestamp::date as date,
-                pcod,
-                sum({self.metric}) as value
-            FROM geolocated_transactions t
-            JOIN cell_mapping c
-            ON t.cell_id = c.id AND t.cell_version = c.version
+                t.timestamp::date as date,
+                c.pcod,
+                sum(t.{self.metric}) as value
+            FROM dfs.transactions t
+            JOIN dfs.transactions_metadata m
+            ON t.id = m.transaction_id
+            JOIN ({self.cell_mapping.get_query()}) c
+            ON m.cell_id = c.id AND m.cell_version = c.version
+            WHERE t.timestamp >= '{self.date_range.start_date_as_str}'::timestamptz
+            AND t.timestamp < '{self.date_range.one_day_past_end_date_as_str}'::timestamptz
             GROUP BY date, pcod
             """
         )
@@ -13,7 +13,6 @@ that fraction of their contacts who account for 80% of their interactions.
 from typing import List, Union
 
 from flowmachine.features.subscriber.contact_balance import ContactBalance
-from flowmachine.features.subscriber.subscriber_degree import SubscriberDegree
 from flowmachine.features.subscriber.metaclasses import SubscriberFeature
 from flowmachine.features.utilities.direction_enum import Direction
 
@@ -102,55 +101,38 @@ class ParetoInteractions(SubscriberFeature):
             subscriber_subset=subscriber_subset,
         )
 
-        self.subscriber_degree = SubscriberDegree(
-            self.start,
-            self.stop,
-            hours=self.hours,
-            tables=self.tables,
-            subscriber_identifier=self.subscriber_identifier,
-            direction=self.direction,
-            exclude_self_calls=self.exclude_self_calls,
-            subscriber_subset=subscriber_subset,
-        )
-
         self._cols = ["subscriber", "pareto"]
 
         super().__init__()
 
     def _make_query(self):
 
-        target_qur = f"""
-        SELECT b.subscriber, ceil(sum(events*{self.proportion})) as target
-        FROM ({self.contact_balance.get_query()}) b
-        GROUP BY b.subscriber
-        """
-
+        # Calculate each subscriber's target number of events and degree
+        # alongside the cumulative events, so that the contact balance only
+        # needs to be partitioned and sorted once. Contact balance has one row
+        # per counterpart, so the degree is the number of rows per subscriber.
         cumulative_events = f"""
-        SELECT row_number() OVER (
-        PARTITION BY c.subscriber ORDER BY events DESC, c.msisdn_counterpart DESC) AS n_contacts,
-         c.subscriber, c.msisdn_counterpart, c.events,
-          sum(c.events) OVER (
-        PARTITION BY c.subscriber ORDER BY events DESC, c.msisdn_counterpart DESC) AS cum_events
+        SELECT c.subscriber,
+            row_number() OVER w AS n_contacts,
+            sum(c.events) OVER w AS cum_events,
+            ceil(sum(c.events*{self.proportion}) OVER (PARTITION BY c.subscriber)) AS target,
+            count(*) OVER (PARTITION BY c.subscriber) AS degree
         FROM ({self.contact_balance.get_query()}) c
-        ORDER BY cum_events DESC
+        WINDOW w AS (
+            PARTITION BY c.subscriber ORDER BY c.events DESC, c.msisdn_counterpart DESC
+        )
         """
 
         subscriber_count = f"""
-        SELECT DISTINCT ON(cu.subscriber) n_contacts, cu.subscriber as subscriber, (tgt.target - cu.cum_events) as dif FROM
+        SELECT cu.subscriber, min(cu.n_contacts) AS n_contacts, cu.degree FROM
         ({cumulative_events}) cu
-        LEFT JOIN
-        ({target_qur}) tgt
-        ON cu.subscriber = tgt.subscriber
-        WHERE (tgt.target - cu.cum_events) <= 0
-        ORDER BY cu.subscriber, n_contacts
+        WHERE cu.cum_events >= cu.target
+        GROUP BY cu.subscriber, cu.degree
         """
 
         sql = f"""
-        SELECT uc.subscriber as subscriber, uc.n_contacts/ud.value::FLOAT as value FROM
+        SELECT uc.subscriber as subscriber, uc.n_contacts/uc.degree::FLOAT as value FROM
         ({subscriber_count}) uc
-        LEFT JOIN
-        ({self.subscriber_degree.get_query()}) ud
-        ON uc.subscriber = ud.subscriber
         ORDER BY uc.subscriber
         """
 
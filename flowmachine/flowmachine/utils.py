@@ -9,7 +9,7 @@ Various simple utilities.
 
 import datetime
 import re
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 
 from pglast import prettify
 from psycopg2._psycopg import adapt
@@ -37,6 +37,13 @@ def parse_datestring(
     elif isinstance(datestring, datetime.date):
         return datetime.datetime(datestring.year, datestring.month, datestring.day)
     else:
+        if len(datestring) == 10:
+            # Fast path for the most common case (a YYYY-MM-DD date), which
+            # would otherwise only be tried after both datetime formats fail
+            try:
+                return datetime.datetime.strptime(datestring, "%Y-%m-%d")
+            except ValueError:
+                pass
         try:
             return datetime.datetime.strptime(datestring, "%Y-%m-%d %X")
         except ValueError:
@@ -217,6 +224,10 @@ def _makesafe(x):
     return adapt(x).getquoted().decode()
 
 
+_ALIAS_SEPARATOR = re.compile(" as ", flags=re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
 def get_name_and_alias(column_name: str) -> Tuple[str]:
     """
     Given a column name string, return the column name and alias (if there is
@@ -233,7 +244,7 @@ def get_name_and_alias(column_name: str) -> Tuple[str]:
     >>> get_name_and_alias("table.col as alias")
       ('table.col', 'alias')
     """
-    column_name_split = re.split(" as ", column_name, flags=re.IGNORECASE)
+    column_name_split = _ALIAS_SEPARATOR.split(column_name)
     if len(column_name_split) == 1:
         return column_name_split[0].strip(), column_name_split[0].strip().split(".")[-1]
     else:
@@ -134,7 +134,17 @@ def skip_datecheck(request, monkeypatch):
 
 
 @pytest.fixture(autouse=True)
-def flowmachine_connect():
+def flowmachine_connect(request):
+    """
+    Connects flowmachine to flowdb and redis for the duration of the test,
+    and resets the cache afterwards.
+
+    Use the `no_db` py mark on tests which never touch the database (e.g. argument
+    validation tests) to skip connecting and resetting.
+    """
+    if request.node.get_closest_marker("no_db", False):
+        yield
+        return
     with connections():
         yield
         reset_cache(get_db(), get_redis(), protect_table_objects=False)
@@ -197,6 +207,35 @@ def get_dataframe(flowmachine_connect):
     )
 
 
+@pytest.fixture(scope="module")
+def dataframe_cache():
+    """
+    Results of queries run using get_cached_dataframe, keyed by query ID.
+    These are copies of the results held by the tests, so unlike stored
+    queries they are not removed when the cache is reset after each test.
+    """
+    return {}
+
+
+@pytest.fixture
+def get_cached_dataframe(get_dataframe, dataframe_cache):
+    """
+    Like get_dataframe, but each query is only run once per test module.
+    Only use this for queries whose result doesn't depend on the state of the
+    cache (i.e. almost all feature queries over the test data).
+    """
+
+    def _get_cached_dataframe(query):
+        try:
+            df = dataframe_cache[query.query_id]
+        except KeyError:
+            df = dataframe_cache[query.query_id] = get_dataframe(query)
+        # Copy, so that tests can't modify the results seen by other tests
+        return df.copy()
+
+    yield _get_cached_dataframe
+
+
 @pytest.fixture
 def get_column_names_from_run(flowmachine_connect):
     yield lambda query: pd.read_sql_query(
@@ -124,7 +124,8 @@ async def test_generic_error_catch(server_config):
     mock_socket = Mock()
     mock_socket.send_multipart = CoroutineMock()
     expected_response = [
-        "DUMMY_RETURN_ADDRESS",
+        b"DUMMY_RETURN_ADDRESS",
+        b"DUMMY_MESSAGE_ID",
         b"",
         rapidjson.dumps(
             ZMQReply(status="error", msg="Could not get reply for message")
@@ -136,7 +137,7 @@ async def test_generic_error_catch(server_config):
         mock_get_reply.side_effect = Exception("Didn't see this one coming!")
         await calculate_and_send_reply_for_message(
             socket=mock_socket,
-            return_address="DUMMY_RETURN_ADDRESS",
+            return_address=[b"DUMMY_RETURN_ADDRESS", b"DUMMY_MESSAGE_ID"],
             msg_contents="DUMMY_MESSAGE",
             config=server_config,
         )
@@ -6,7 +6,7 @@
 Tests for cache management utilities.
 """
 from cachey import Scorer
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
@@ -577,6 +577,28 @@ def test_cache_ddl_op_error(dummy_redis):
     assert qsm.current_query_state == QueryState.ERRORED
 
 
+def test_cache_sql_execution_error(dummy_redis, caplog):
+    """
+    Test that errors when executing SQL are logged, and leave the query state machine in error state.
+    """
+
+    query_mock = Mock(query_id="DUMMY_MD5")
+    qsm = QueryStateMachine(dummy_redis, "DUMMY_MD5", "DUMMY_CONNECTION")
+    qsm.enqueue()
+
+    with pytest.raises(TestException):
+        write_query_to_cache(
+            name="DUMMY_QUERY",
+            redis=dummy_redis,
+            query=query_mock,
+            connection=MagicMock(conn_id="DUMMY_CONNECTION"),
+            ddl_ops_func=Mock(return_value=["THIS IS NOT VALID SQL"]),
+            write_func=Mock(side_effect=TestException),
+        )
+    assert "Error executing SQL" in caplog.messages[-1]
+    assert qsm.current_query_state == QueryState.ERRORED
+
+
 @pytest.mark.asyncio
 async def test_cache_watch_does_shrink(flowmachine_connect):
     """
@@ -10,6 +10,7 @@ import re
 import textwrap
 import IPython
 from io import StringIO
+from unittest.mock import PropertyMock
 
 from flowmachine.core import CustomQuery
 from flowmachine.core.dummy_query import DummyQuery
@@ -105,15 +106,13 @@ def test_unstored_dependencies_graph():
     dummy5 = DummyQuery(dummy_param=["dummy5", dummy3, dummy4])
     dummy3.store()
 
-    expected_query_nodes = [dummy2, dummy4]
+    expected_node_ids = {f"x{query.query_id}" for query in [dummy2, dummy4]}
     graph = unstored_dependencies_graph(dummy5)
-    assert not any(dict(graph.nodes(data="stored")).values())
-    assert len(graph) == len(expected_query_nodes)
-    for query in expected_query_nodes:
-        assert f"x{query.query_id}" in graph.nodes()
-        assert (
-            graph.nodes[f"x{query.query_id}"]["query_object"].query_id == query.query_id
-        )
+    assert not any(stored for _, stored in graph.nodes(data="stored"))
+    assert set(graph.nodes()) == expected_node_ids
+    assert all(
+        node == f"x{query.query_id}" for node, query in graph.nodes(data="query_object")
+    )
 
 
 def test_unstored_dependencies_graph_for_stored_query():
@@ -129,6 +128,34 @@ def test_unstored_dependencies_graph_for_stored_query():
     assert len(graph) == 0
 
 
+def test_unstored_dependencies_graph_checks_shared_dependency_once(monkeypatch):
+    """
+    Test that unstored_dependencies_graph only checks whether a dependency is stored
+    once, even if several queries depend on it, and includes all edges to it.
+    """
+    # Create dummy queries with dependency structure
+    #
+    #           4:unstored
+    #            /       \
+    #       2:unstored  3:unstored
+    #            \       /
+    #           1:unstored
+    #
+    dummy1 = DummyQuery(dummy_param=["dummy1"])
+    dummy2 = DummyQuery(dummy_param=["dummy2", dummy1])
+    dummy3 = DummyQuery(dummy_param=["dummy3", dummy1])
+    dummy4 = DummyQuery(dummy_param=["dummy4", dummy2, dummy3])
+    is_stored_mock = PropertyMock(return_value=False)
+    monkeypatch.setattr(DummyQuery, "is_stored", is_stored_mock)
+
+    graph = unstored_dependencies_graph(dummy4)
+    assert len(graph) == 3
+    assert graph.has_edge(f"x{dummy2.query_id}", f"x{dummy1.query_id}")
+    assert graph.has_edge(f"x{dummy3.query_id}", f"x{dummy1.query_id}")
+    # Once for each of the four queries
+    assert is_stored_mock.call_count == 4
+
+
 def test_plot_dependency_graph():
     """
     Test that plot_dependency_graph() runs and returns the expected IPython.display objects.
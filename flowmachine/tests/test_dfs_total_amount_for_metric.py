@@ -30,6 +30,26 @@ def test_column_names():
     assert q.head(0).columns.tolist() == q.column_names
 
 
+def test_cell_mapping_shared_between_date_ranges():
+    """
+    Test that queries for different dates depend on the same cell mapping.
+    """
+    q1 = DFSTotalMetricAmount(
+        metric="amount",
+        start_date="2016-01-01",
+        end_date="2016-01-02",
+        aggregation_unit="admin2",
+    )
+    q2 = DFSTotalMetricAmount(
+        metric="fee",
+        start_date="2016-01-03",
+        end_date="2016-01-05",
+        aggregation_unit="admin2",
+    )
+    assert q1.cell_mapping.query_id == q2.cell_mapping.query_id
+    assert q1.cell_mapping in q1.dependencies
+
+
 def test_dfs_total_transaction_amount(get_dataframe):
     """
     Total transaction amount returns expected result.
@@ -30,8 +30,8 @@ def test_handles_dates(get_dataframe):
     minimum = df["datetime"].min().to_pydatetime()
     maximum = df["datetime"].max().to_pydatetime()
 
-    min_comparison = pytz.timezone("Etc/UTC").localize(datetime(2016, 1, 1))
-    max_comparison = pytz.timezone("Etc/UTC").localize(datetime(2016, 1, 2))
+    min_comparison = datetime(2016, 1, 1, tzinfo=pytz.utc)
+    max_comparison = datetime(2016, 1, 2, tzinfo=pytz.utc)
 
     assert minimum.timestamp() > min_comparison.timestamp()
     assert maximum.timestamp() < max_comparison.timestamp()
@@ -68,8 +68,8 @@ def test_handles_mins(get_dataframe):
     minimum = df["datetime"].min().to_pydatetime()
     maximum = df["datetime"].max().to_pydatetime()
 
-    min_comparison = pytz.timezone("Etc/UTC").localize(datetime(2016, 1, 1, 13, 30, 30))
-    max_comparison = pytz.timezone("Etc/UTC").localize(datetime(2016, 1, 2, 16, 25, 0))
+    min_comparison = datetime(2016, 1, 1, 13, 30, 30, tzinfo=pytz.utc)
+    max_comparison = datetime(2016, 1, 2, 16, 25, 0, tzinfo=pytz.utc)
 
     assert minimum.timestamp() > min_comparison.timestamp()
     assert maximum.timestamp() < max_comparison.timestamp()
@@ -103,8 +103,8 @@ def test_can_subset_by_hour(get_dataframe):
     """
     sd = EventTableSubset(start="2016-01-01", stop="2016-01-04", hours=(12, 17))
     df = get_dataframe(sd)
-    df["hour"] = df.datetime.apply(lambda x: x.hour)
-    df["day"] = df.datetime.apply(lambda x: x.day)
+    df["hour"] = df.datetime.dt.hour
+    df["day"] = df.datetime.dt.day
     Range = df.hour.max() - df.hour.min()
     assert 4 == Range
     # Also check that all the dates are still there
@@ -119,8 +119,8 @@ def test_handles_backwards_hours(get_dataframe):
     """
     sd = EventTableSubset(start="2016-01-01", stop="2016-01-04", hours=(20, 5))
     df = get_dataframe(sd)
-    df["hour"] = df.datetime.apply(lambda x: x.hour)
-    df["day"] = df.datetime.apply(lambda x: x.day)
+    df["hour"] = df.datetime.dt.hour
+    df["day"] = df.datetime.dt.day
     unique_hours = list(df.hour.unique())
     unique_hours.sort()
     assert [0, 1, 2, 3, 4, 20, 21, 22, 23] == unique_hours
@@ -139,14 +139,14 @@ def test_default_dates(get_dataframe):
     df = get_dataframe(sd)
 
     minimum = df["datetime"].min().to_pydatetime()
-    min_comparison = pytz.timezone("Etc/UTC").localize(datetime(2016, 1, 1, 0, 0, 0))
+    min_comparison = datetime(2016, 1, 1, 0, 0, 0, tzinfo=pytz.utc)
     assert minimum.timestamp() > min_comparison.timestamp()
 
     sd = EventTableSubset(start="2016-01-04", stop=None, hours=(20, 5))
     df = get_dataframe(sd)
 
     maximum = df["datetime"].max().to_pydatetime()
-    max_comparison = pytz.timezone("Etc/UTC").localize(datetime(2016, 1, 8, 0, 0, 0))
+    max_comparison = datetime(2016, 1, 8, 0, 0, 0, tzinfo=pytz.utc)
     assert maximum.timestamp() < max_comparison.timestamp()
 
 
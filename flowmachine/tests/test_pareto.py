@@ -3,7 +3,9 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 
-from flowmachine.features import ParetoInteractions, ContactBalance
+import pytest
+
+from flowmachine.features import ParetoInteractions, ContactBalance, SubscriberDegree
 import pandas as pd
 import math
 
@@ -57,9 +59,10 @@ def test_pareto_nepal(get_dataframe):
     p = ParetoInteractions("2016-01-01", "2016-01-07")
     df = get_dataframe(p)
     df2 = paretos(get_dataframe(cb))
-    assert all(
-        df.set_index("subscriber").sort_index()
-        == df2.set_index("subscriber").sort_index()
+    pd.testing.assert_frame_equal(
+        df.set_index("subscriber").sort_index(),
+        df2.set_index("subscriber").sort_index(),
+        check_like=True,
     )
 
 
@@ -90,3 +93,29 @@ def test_pareto__call_exclusion(get_length):
         subscriber_subset="self_caller",
     )
     assert 0 == get_length(pi)
+
+
+@pytest.mark.parametrize("direction", ["in", "out", "both"])
+def test_pareto_degree_matches_subscriber_degree(direction, get_dataframe):
+    """
+    Test that the degree ParetoInteractions counts from the contact balance is the
+    same as SubscriberDegree, and that the pareto values are unchanged, for each direction.
+    """
+    p = ParetoInteractions("2016-01-01", "2016-01-07", direction=direction)
+    cb = get_dataframe(p.contact_balance)
+    sd = get_dataframe(
+        SubscriberDegree(
+            "2016-01-01", "2016-01-07", direction=direction, exclude_self_calls=False
+        )
+    )
+    assert (
+        cb.groupby("subscriber").size().to_dict()
+        == sd.set_index("subscriber").value.to_dict()
+    )
+    df = get_dataframe(p)
+    df2 = paretos(cb)
+    pd.testing.assert_frame_equal(
+        df.set_index("subscriber").sort_index(),
+        df2.set_index("subscriber").sort_index(),
+        check_like=True,
+    )
@@ -28,9 +28,7 @@ def test_bad_sql_logged_and_raised(caplog):
             return []
 
     with pytest.raises(ProgrammingError):
-        fut = BadQuery().store()
-        exec = fut.exception()
-        raise exec
+        BadQuery().store().result()
     assert "Error executing SQL" in caplog.messages[-1]
 
 
@@ -87,14 +85,12 @@ def test_is_stored():
         def column_names(self) -> List[str]:
             return ["1"]
 
+    # The cache is reset after every test, so the query starts out unstored
     sq = storable_query()
-    sq.invalidate_db_cache()
     assert not sq.is_stored
 
-    sq = storable_query()
     sq.store().result()
     assert sq.is_stored
-    sq.invalidate_db_cache()
 
 
 def test_return_table():
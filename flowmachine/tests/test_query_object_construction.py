@@ -335,3 +335,67 @@ def test_invalid_sampling_params_raises_error(sampling, message):
     with pytest.raises(ValidationError, match=message) as exc:
         _ = FlowmachineQuerySchema().load(query_spec)
     print(exc)
+
+
+@pytest.mark.parametrize("proportion", [0.0, 1.0])
+def test_invalid_pareto_proportion_raises_error(proportion):
+    """
+    Test that a pareto interactions proportion outside the open interval (0, 1)
+    is rejected by the schema, rather than when constructing the query.
+    """
+    query_spec = {
+        "query_kind": "joined_spatial_aggregate",
+        "method": "avg",
+        "locations": {
+            "query_kind": "daily_location",
+            "date": "2016-01-01",
+            "aggregation_unit": "admin3",
+            "method": "last",
+        },
+        "metric": {
+            "query_kind": "pareto_interactions",
+            "start": "2016-01-01",
+            "stop": "2016-01-02",
+            "proportion": proportion,
+        },
+    }
+    with pytest.raises(
+        ValidationError, match="Must be greater than 0.0 and less than 1.0."
+    ):
+        _ = FlowmachineQuerySchema().load(query_spec)
+
+
+def test_meaningful_locations_query_object_constructed_once():
+    """
+    Test that an exposed meaningful locations query only constructs its
+    flowmachine query object once.
+    """
+    query_spec = {
+        "query_kind": "meaningful_locations_aggregate",
+        "aggregation_unit": "admin1",
+        "start_date": "2016-01-01",
+        "end_date": "2016-01-02",
+        "label": "unknown",
+        "labels": {
+            "evening": {
+                "type": "Polygon",
+                "coordinates": [
+                    [[1e-06, -0.5], [1e-06, -1.1], [1.1, -1.1], [1.1, -0.5]]
+                ],
+            },
+        },
+        "tower_hour_of_day_scores": [0] * 24,
+        "tower_day_of_week_scores": {
+            "monday": 1,
+            "tuesday": 1,
+            "wednesday": 1,
+            "thursday": 0,
+            "friday": -1,
+            "saturday": -1,
+            "sunday": -1,
+        },
+    }
+    exposed_query = FlowmachineQuerySchema().load(query_spec)
+    query_obj = exposed_query._flowmachine_query_obj
+    assert exposed_query._flowmachine_query_obj is query_obj
+    assert exposed_query.query_id == query_obj.query_id
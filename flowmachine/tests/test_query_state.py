@@ -179,3 +179,22 @@ def test_drop_query_errors():
     qsm.execute()
     with pytest.raises(QueryResetFailedException):
         q.invalidate_db_cache()
+
+
+def test_lookup_query_state(dummy_redis):
+    """Test that looking up a query's state does not create a state machine for it."""
+    assert (
+        QueryStateMachine.lookup_query_state(
+            dummy_redis, "DUMMY_QUERY_ID", get_db().conn_id
+        )
+        is None
+    )
+    assert dummy_redis._store == {}
+    state_machine = QueryStateMachine(dummy_redis, "DUMMY_QUERY_ID", get_db().conn_id)
+    state_machine.enqueue()
+    assert (
+        QueryStateMachine.lookup_query_state(
+            dummy_redis, "DUMMY_QUERY_ID", get_db().conn_id
+        )
+        == QueryState.QUEUED
+    )
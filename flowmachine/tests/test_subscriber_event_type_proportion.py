@@ -2,7 +2,7 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-from flowmachine.features.subscriber.event_type_proportion import *
+from flowmachine.features.subscriber.event_type_proportion import ProportionEventType
 
 import pytest
 
@@ -37,8 +37,8 @@ def test_proportion_event_type(
             "events.forwards",
         ],
     )
-    df = get_dataframe(query).set_index("subscriber")
-    assert df.value[msisdn] == pytest.approx(want)
+    df = get_dataframe(query)
+    assert df.loc[df.subscriber == msisdn, "value"].tolist() == pytest.approx([want])
 
     query = ProportionEventType(
         "2016-01-02",
@@ -48,5 +48,5 @@ def test_proportion_event_type(
         tables=numerator,
         direction=numerator_direction,
     )
-    df = get_dataframe(query).set_index("subscriber")
+    df = get_dataframe(query)
     assert df.value.unique() == [1]
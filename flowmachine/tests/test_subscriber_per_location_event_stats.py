@@ -3,7 +3,9 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from flowmachine.core import make_spatial_unit
-from flowmachine.features.subscriber.per_location_event_stats import *
+from flowmachine.features.subscriber.per_location_event_stats import (
+    PerLocationEventStats,
+)
 
 import pytest
 
@@ -38,6 +40,7 @@ def test_per_location_event_stats(get_dataframe, kwargs, msisdn, want):
     assert df.value[msisdn] == pytest.approx(want)
 
 
+@pytest.mark.no_db
 @pytest.mark.parametrize("kwarg", ["direction", "statistic"])
 def test_per_location_event_stats_errors(kwarg):
     """ Test ValueError is raised for non-compliant kwarg in PerLocationEventStats. """
@@ -15,6 +15,7 @@ from time import sleep
 import pytest
 import os
 import pandas as pd
+import zmq
 
 import flowmachine
 from flowmachine.core import Connection, Query
@@ -173,6 +174,43 @@ def zmq_port():
     return os.getenv("FLOWMACHINE_PORT", "5555")
 
 
+@pytest.fixture(scope="session")
+def send_zmq_message(zmq_host, zmq_port):
+    """
+    Return a function which sends a JSON message to the flowmachine server
+    and returns the reply. Messages are sent over a single REQ socket, which
+    is connected once for the whole test session and replaced if a send or
+    receive fails (a REQ socket which has not received its reply cannot be
+    used again).
+    """
+    # Use a separate context, because send_zmq_message_and_receive_reply
+    # shares the global context instance with other tests
+    context = zmq.Context()
+    context.setsockopt(zmq.LINGER, 0)
+    context.setsockopt(zmq.RCVTIMEO, 60000)
+    context.setsockopt(zmq.SNDTIMEO, 60000)
+
+    def _connect():
+        socket = context.socket(zmq.REQ)
+        socket.connect(f"tcp://{zmq_host}:{zmq_port}")
+        return socket
+
+    current = {"socket": _connect()}
+
+    def _send_zmq_message(msg):
+        try:
+            current["socket"].send_json(msg)
+            return current["socket"].recv_json()
+        except zmq.ZMQError:
+            current["socket"].close()
+            current["socket"] = _connect()
+            raise
+
+    yield _send_zmq_message
+    current["socket"].close()
+    context.term()
+
+
 @pytest.fixture(scope="session")
 def redis():
     """
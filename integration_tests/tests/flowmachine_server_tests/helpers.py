@@ -1,10 +1,14 @@
+import asyncio
 import itertools
 import zmq
 import textwrap
 import time
 from sqlalchemy import inspect
 
-from flowmachine.core.server.utils import send_zmq_message_and_receive_reply
+from flowmachine.core.server.utils import (
+    send_zmq_message_and_receive_reply,
+    send_zmq_message_and_await_reply,
+)
 
 
 def poll_until_done(port, query_id, max_tries=100):
@@ -29,6 +33,27 @@ def poll_until_done(port, query_id, max_tries=100):
         time.sleep(0.1)
 
 
+async def await_until_done(port, query_id, max_tries=100, host="localhost"):
+    """
+    Asynchronous version of poll_until_done, so that several queries
+    can be waited for concurrently. Polls flowmachine at `host` on
+    port `port`.
+    """
+    msg = {
+        "action": "poll_query",
+        "params": {"query_id": query_id},
+        "request_id": "DUMMY_ID",
+    }
+
+    for i in itertools.count():
+        if i > max_tries:
+            raise RuntimeError("Timeout reached but query is not done. Aborting.")
+        reply = await send_zmq_message_and_await_reply(msg, port=port, host=host)
+        if "completed" == reply["payload"]["query_state"]:
+            break
+        await asyncio.sleep(0.1)
+
+
 def get_cache_tables(fm_conn, exclude_internal_tables=True):
     """
     Return any tables present in the cache schema in flowdb.
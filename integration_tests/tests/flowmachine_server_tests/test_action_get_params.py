@@ -2,79 +2,98 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import asyncio
+
 import pytest
 
-from flowmachine.core.server.utils import send_zmq_message_and_receive_reply
-from .helpers import poll_until_done
+from flowmachine.core.server.utils import send_zmq_message_and_await_reply
+from .helpers import await_until_done
 
 
 # TODO: add test for code path that raises QueryProxyError with the 'get_params' action
 
 
-@pytest.mark.parametrize(
-    "params",
-    [
-        {
-            "query_kind": "spatial_aggregate",
-            "locations": {
-                "query_kind": "daily_location",
-                "date": "2016-01-01",
-                "method": "last",
-                "aggregation_unit": "admin3",
-                "subscriber_subset": None,
-            },
+QUERY_PARAMS = [
+    {
+        "query_kind": "spatial_aggregate",
+        "locations": {
+            "query_kind": "daily_location",
+            "date": "2016-01-01",
+            "method": "last",
+            "aggregation_unit": "admin3",
+            "subscriber_subset": None,
         },
-        {
-            "query_kind": "spatial_aggregate",
-            "locations": {
-                "query_kind": "daily_location",
-                "date": "2016-01-04",
-                "method": "most-common",
-                "aggregation_unit": "admin1",
-                "subscriber_subset": None,
-            },
+    },
+    {
+        "query_kind": "spatial_aggregate",
+        "locations": {
+            "query_kind": "daily_location",
+            "date": "2016-01-04",
+            "method": "most-common",
+            "aggregation_unit": "admin1",
+            "subscriber_subset": None,
         },
-    ],
-)
-def test_get_query_params(params, zmq_port, zmq_host):
+    },
+]
+
+
+@pytest.mark.asyncio
+async def test_get_query_params(zmq_port, zmq_host):
     """
     Running 'get_query_params' against an existing query_id returns the expected parameters with which the query was run.
     """
     #
-    # Run query.
+    # Run queries. These are independent, so send the messages for all of
+    # them at once rather than waiting for each in turn.
     #
-    msg = {"action": "run_query", "params": params, "request_id": "DUMMY_ID"}
-
-    reply = send_zmq_message_and_receive_reply(msg, port=zmq_port, host=zmq_host)
-    query_id = reply["payload"]["query_id"]
-    # assert reply["status"] in ("executing", "queued", "completed")
-    assert reply["status"] == "success"
+    replies = await asyncio.gather(
+        *[
+            send_zmq_message_and_await_reply(
+                {"action": "run_query", "params": params, "request_id": "DUMMY_ID"},
+                port=zmq_port,
+                host=zmq_host,
+            )
+            for params in QUERY_PARAMS
+        ]
+    )
+    assert all(reply["status"] == "success" for reply in replies)
+    query_ids = [reply["payload"]["query_id"] for reply in replies]
 
     #
-    # Wait until the query has finished.
+    # Wait until the queries have finished.
     #
-    poll_until_done(zmq_port, query_id)
+    await asyncio.gather(
+        *[await_until_done(zmq_port, query_id, host=zmq_host) for query_id in query_ids]
+    )
 
     #
-    # Get query result.
+    # Get query params.
     #
-    msg = {
-        "action": "get_query_params",
-        "params": {"query_id": query_id},
-        "request_id": "DUMMY_ID",
-    }
-
-    reply = send_zmq_message_and_receive_reply(msg, port=zmq_port, host=zmq_host)
-    expected_reply = {
-        "status": "success",
-        "msg": "",
-        "payload": {"query_id": query_id, "query_params": params},
-    }
-    assert expected_reply == reply
+    replies = await asyncio.gather(
+        *[
+            send_zmq_message_and_await_reply(
+                {
+                    "action": "get_query_params",
+                    "params": {"query_id": query_id},
+                    "request_id": "DUMMY_ID",
+                },
+                port=zmq_port,
+                host=zmq_host,
+            )
+            for query_id in query_ids
+        ]
+    )
+    for query_id, params, reply in zip(query_ids, QUERY_PARAMS, replies):
+        expected_reply = {
+            "status": "success",
+            "msg": "",
+            "payload": {"query_id": query_id, "query_params": params},
+        }
+        assert expected_reply == reply
 
 
 @pytest.mark.skip(reason="The 'get_query_params' action will likely be removed soon.")
-def test_get_query_params_for_nonexistent_query_id(zmq_port, zmq_host):
+def test_get_query_params_for_nonexistent_query_id(send_zmq_message):
     """
     Running 'get_query_params' on a non-existent query id returns an error.
     """
@@ -87,7 +106,7 @@ def test_get_query_params_for_nonexistent_query_id(zmq_port, zmq_host):
         "request_id": "DUMMY_ID",
     }
 
-    reply = send_zmq_message_and_receive_reply(msg, port=zmq_port, host=zmq_host)
+    reply = send_zmq_message(msg)
     assert {
         "status": "awol",
         "id": "FOOBAR",
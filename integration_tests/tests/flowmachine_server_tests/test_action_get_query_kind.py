@@ -1,6 +1,5 @@
 import pytest
 
-from flowmachine.core.server.utils import send_zmq_message_and_receive_reply
 from .helpers import poll_until_done
 
 
@@ -32,7 +31,7 @@ from .helpers import poll_until_done
         },
     ],
 )
-def test_get_query_kind(params, zmq_port, zmq_host):
+def test_get_query_kind(params, zmq_port, send_zmq_message):
     """
     Running 'get_query_kind' against an existing query_id returns the expected query kind.
     """
@@ -41,7 +40,7 @@ def test_get_query_kind(params, zmq_port, zmq_host):
     #
     msg = {"action": "run_query", "params": params, "request_id": "DUMMY_ID"}
 
-    reply = send_zmq_message_and_receive_reply(msg, port=zmq_port, host=zmq_host)
+    reply = send_zmq_message(msg)
     # assert reply["status"] in ("executing", "queued", "completed")
     assert reply["status"] in ("success")
     query_id = reply["payload"]["query_id"]
@@ -60,13 +59,13 @@ def test_get_query_kind(params, zmq_port, zmq_host):
         "request_id": "DUMMY_ID",
     }
 
-    reply = send_zmq_message_and_receive_reply(msg, port=zmq_port, host=zmq_host)
+    reply = send_zmq_message(msg)
     assert "success" == reply["status"]
     assert query_id == reply["payload"]["query_id"]
     assert "spatial_aggregate" == reply["payload"]["query_kind"]
 
 
-def test_get_query_kind_for_nonexistent_query_id(zmq_port, zmq_host):
+def test_get_query_kind_for_nonexistent_query_id(send_zmq_message):
     """
     Running 'get_query_kind' on a non-existent query id returns an error.
     """
@@ -79,7 +78,7 @@ def test_get_query_kind_for_nonexistent_query_id(zmq_port, zmq_host):
         "request_id": "DUMMY_ID",
     }
 
-    reply = send_zmq_message_and_receive_reply(msg, port=zmq_port, host=zmq_host)
+    reply = send_zmq_message(msg)
     assert {
         "status": "error",
         "payload": {"query_id": "FOOBAR", "query_state": "awol"},